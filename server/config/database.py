@@ -1,34 +1,134 @@
-import re
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, configure_mappers
-from sqlalchemy.dialects.postgresql.base import PGDialect
+import functools
+import os
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL
+from sqlalchemy.orm import DeclarativeBase, sessionmaker, configure_mappers, raiseload, selectinload
+from sqlalchemy.dialects import registry
+from sqlalchemy.dialects.postgresql.psycopg import PGDialect_psycopg
+from sqlalchemy.pool import NullPool, QueuePool
 
-# Patch SQLAlchemy for CockroachDB version parsing
-def _get_server_version_info(self, connection):
-    version_string = connection.exec_driver_sql("SELECT version()").scalar()
-    match = re.match(r"CockroachDB.*v(\d+)\.(\d+)\.(\d+)", version_string)
-    if match:
-        return tuple(int(x) for x in match.groups())
-    return (20, 0, 0)
+_FALLBACK_VERSION = (20, 0, 0)
+_DIGITS = "0123456789"
 
-PGDialect._get_server_version_info = _get_server_version_info
+@functools.lru_cache(maxsize=8)
+def _parse_version(version_string):
+    # e.g. "CockroachDB CCL v23.1.11 (x86_64-pc-linux-gnu, ...)"
+    if not version_string.startswith("CockroachDB"):
+        return _FALLBACK_VERSION
+    i = version_string.find(" v")
+    if i < 0:
+        return _FALLBACK_VERSION
+    major, _, rest = version_string[i + 2:].partition(".")
+    minor, _, rest = rest.partition(".")
+    patch = rest[:len(rest) - len(rest.lstrip(_DIGITS))]
+    try:
+        return (int(major), int(minor), int(patch))
+    except ValueError:
+        return _FALLBACK_VERSION
+
+class CockroachDialect(PGDialect_psycopg):
+    """psycopg 3 dialect that understands CockroachDB's version() string.
+
+    Registered under its own URL scheme so plain PostgreSQL engines keep
+    SQLAlchemy's normal server version detection.
+    """
+
+    def _get_server_version_info(self, connection):
+        # Memoize on the dialect so re-created engines skip the SELECT version() roundtrip
+        cached = getattr(self, "_cockroach_version_cache", None)
+        if cached is not None:
+            return cached
+        version_string = connection.exec_driver_sql("SELECT version()").scalar()
+        result = _parse_version(version_string)
+        self._cockroach_version_cache = result
+        return result
+
+registry.register("cockroachdb", __name__, "CockroachDialect")
+
+DATABASE_URL = URL.create(
+    drivername="cockroachdb",
+    username="root",
+    host="localhost",
+    port=26257,
+    database="resume_db",
+    query={"sslmode": "disable"},
+)
 
-DATABASE_URL = "postgresql://root@localhost:26257/resume_db?sslmode=disable"
+# Short-lived processes (scripts, migrations) skip pooling entirely
+if os.getenv("DB_SHORT_LIVED"):
+    _pool_options = {"poolclass": NullPool}
+else:
+    _pool_options = {
+        "poolclass": QueuePool,
+        "pool_size": 20,
+        "max_overflow": 40,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+        "pool_use_lifo": True,
+    }
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
+# Opt-in isolation level, e.g. DB_ISOLATION_LEVEL="READ COMMITTED"; unset keeps
+# CockroachDB's default SERIALIZABLE. READ COMMITTED also needs the cluster setting
+# sql.txn.read_committed_isolation.enabled, without which transactions are silently
+# run as SERIALIZABLE anyway.
+if os.getenv("DB_ISOLATION_LEVEL"):
+    _pool_options["isolation_level"] = os.environ["DB_ISOLATION_LEVEL"]
 
-# Import models to ensure they are registered with SQLAlchemy
-from models import models  # Adjust the import path if necessary
+engine = create_engine(
+    DATABASE_URL,
+    **_pool_options,
+    # get_db() ends every transaction itself, so skip the ROLLBACK on checkin
+    pool_reset_on_return=None,
+    query_cache_size=1200,
+    insertmanyvalues_page_size=1000,
+    # No hstore columns, so skip the per-connection hstore OID probe
+    use_native_hstore=False,
+    # psycopg 3 switches to server-side prepared statements after N executions
+    connect_args={"prepare_threshold": 5},
+)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)
 
-# Configure mappers to resolve relationships
-configure_mappers()
+@event.listens_for(SessionLocal, "do_orm_execute")
+def _apply_eager_loading(orm_execute_state):
+    """selectinload every relationship marked info={"eager": True} on the queried entities."""
+    if (
+        not orm_execute_state.is_select
+        or orm_execute_state.is_column_load
+        or orm_execute_state.is_relationship_load
+    ):
+        return
+    options = [
+        selectinload(getattr(mapper.class_, rel.key))
+        for mapper in orm_execute_state.all_mappers
+        for rel in mapper.relationships
+        if rel.info.get("eager")
+    ]
+    if options:
+        orm_execute_state.statement = orm_execute_state.statement.options(*options)
+
+def default_options():
+    """Loader options applied to every query; lazy loads raise in development."""
+    return (raiseload("*"),) if os.getenv("ENV") == "dev" else ()
+
+def query(session, entity):
+    return session.query(entity).options(*default_options())
+
+class Base(DeclarativeBase):
+    pass
+
+def init_orm():
+    """Configure mappers once, after the full model graph has been registered."""
+    # Import models lazily so DB-free callers skip building the mappers
+    from models import models  # noqa: F401
+    # Configure mappers to resolve relationships
+    configure_mappers()
 
 def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
\ No newline at end of file
+    # Session is its own context manager and closes itself on exit
+    with SessionLocal() as db:
+        try:
+            yield db
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
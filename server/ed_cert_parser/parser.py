@@ -6,34 +6,39 @@ Extracts information from PDF certificates including university certificates and
 
 import os
 import re
-import json
 import sys
 import argparse
+import asyncio
+import itertools
+import functools
+import importlib
+import mmap
+import multiprocessing
+import threading
+import time
+from contextlib import nullcontext
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Tuple
 from datetime import datetime
 import logging
 
 # Third-party imports
 try:
-    import pdfplumber
+    import fitz
     import pytesseract
-    import easyocr
-    import cv2
     import numpy as np
     from PIL import Image
-    import spacy
-    import dateparser
     import requests
-    from pyzbar import pyzbar
-    import qrcode
+    import orjson
     from urllib.parse import urlparse
     import hashlib
     import base64
 except ImportError as e:
     print(f"Missing required package: {e.name}")
     print("Please install required packages:")
-    print("pip install pdfplumber pytesseract easyocr opencv-python pillow spacy dateparser requests pyzbar qrcode urllib3")
+    print("pip install pymupdf pytesseract easyocr opencv-python pillow spacy dateparser requests orjson pyzbar urllib3")
     print("python -m spacy download en_core_web_sm")
     sys.exit(1)
 
@@ -41,6 +46,158 @@ except ImportError as e:
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# EasyOCR/PyTorch, spaCy, OpenCV, pyzbar and dateparser cost seconds and hundreds
+# of MB to import, so they are loaded on first use rather than at import time
+_MODULES = {}
+
+def _lazy(name):
+    module = _MODULES.get(name)
+    if module is None:
+        module = _MODULES[name] = importlib.import_module(name)
+    return module
+
+# Optional multi-keyword matcher for authenticity checks
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# Optional in-process Tesseract binding; avoids a tesseract subprocess per page
+try:
+    from tesserocr import PyTessBaseAPI, PSM, OEM
+    HAS_TESSEROCR = True
+except ImportError:
+    HAS_TESSEROCR = False
+
+# Optional async prompt so interactive commands can be typed while a batch runs
+try:
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.patch_stdout import patch_stdout
+    HAS_PROMPT_TOOLKIT = True
+except ImportError:
+    HAS_PROMPT_TOOLKIT = False
+
+# Optional linear-time regex engine for the extraction patterns
+try:
+    import re2 as pattern_re
+    HAS_RE2 = True
+except ImportError:
+    pattern_re = re
+    HAS_RE2 = False
+
+# Model singletons shared by every CertificateProcessor in the process; loading
+# EasyOCR and spaCy takes seconds, so it must not be repeated per instance.
+# False marks a load that already failed so it is not retried on every access.
+_EASYOCR = None
+_NLP = None
+
+# OCR threads shared by every document in the process. The pool is kept alive so
+# per-thread Tesseract engines survive between PDFs; process pool workers shrink
+# it to their share of the CPUs instead of each running cpu_count threads.
+_OCR_THREADS = os.cpu_count() or 1
+_OCR_EXECUTOR = None
+_OCR_EXECUTOR_LOCK = threading.Lock()
+
+def _ocr_executor() -> ThreadPoolExecutor:
+    global _OCR_EXECUTOR
+    with _OCR_EXECUTOR_LOCK:
+        if _OCR_EXECUTOR is None:
+            _OCR_EXECUTOR = ThreadPoolExecutor(max_workers=_OCR_THREADS, thread_name_prefix="ocr")
+        return _OCR_EXECUTOR
+
+# Part of every result cache key; bump it whenever extraction output changes so
+# documents cached by an older parser are processed again
+PARSER_VERSION = 2
+
+# Per-thread OCR state, kept at module level so it lives as long as the thread
+# rather than one CertificateProcessor: a Tesseract API handle and a CLAHE object
+# both hold scratch state and are not thread-safe.
+_ocr_local = threading.local()
+
+def _share_ocr_threads(workers: int):
+    """Size this worker process's OCR pool to its share of the CPUs."""
+    global _OCR_THREADS, _OCR_EXECUTOR
+    _OCR_THREADS = max(1, (os.cpu_count() or 1) // workers)
+    # Drop any executor created before the new size applied; it is rebuilt on first use
+    _OCR_EXECUTOR = None
+
+def _get_easyocr():
+    global _EASYOCR
+    if _EASYOCR is None:
+        try:
+            # EasyOCR falls back to CPU on its own when no CUDA device is present
+            _EASYOCR = _lazy("easyocr").Reader(["en"], gpu=True, cudnn_benchmark=True)
+        except Exception as e:
+            logger.warning(f"EasyOCR initialization failed: {e}")
+            _EASYOCR = False
+            return None
+        # Run one dummy page through EasyOCR so cuDNN autotuning happens at startup
+        if _EASYOCR.device != "cpu":
+            try:
+                _EASYOCR.readtext_batched([np.zeros((792, 612, 3), dtype=np.uint8)])
+            except Exception as e:
+                logger.warning(f"EasyOCR warmup failed: {e}")
+    return _EASYOCR or None
+
+def _get_nlp():
+    global _NLP
+    if _NLP is None:
+        try:
+            # Only NER is used, so skip the tagger/parser/lemmatizer passes
+            _NLP = _lazy("spacy").load("en_core_web_sm", disable=["tagger", "parser", "lemmatizer", "attribute_ruler"])
+        except OSError:
+            logger.warning("spaCy model not found. Install with: python -m spacy download en_core_web_sm")
+            _NLP = False
+    return _NLP or None
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """Parse a date string with dateparser, memoized since certificates repeat dates."""
+    # Restricting to English skips dateparser's language auto-detection
+    return _lazy("dateparser").parse(date_str, languages=['en'],
+                            settings={'PREFER_DATES_FROM': 'past', 'STRICT_PARSING': False})
+
+# Names preferred outright when they show up as a university match
+_PRIORITY_INSTITUTIONS = frozenset(["Meta", "Google", "IBM", "Microsoft", "Amazon", "Facebook", "Apple"])
+
+# Words that mark a degree match as a real course or degree name
+_COURSE_WORDS = ("introduction", "development", "science", "engineering", "certificate", "diploma", "bachelor", "master")
+
+def _university_rank(match: str, match_lower: str) -> int:
+    return 1 if match in _PRIORITY_INSTITUTIONS else 0
+
+def _degree_rank(match: str, match_lower: str) -> int:
+    if "introduction" in match_lower:
+        return 2
+    return 1 if any(word in match_lower for word in _COURSE_WORDS) else 0
+
+def _best(raws, min_len: int, rank=None, prefer: str = "min") -> Optional[str]:
+    """Pick the best stripped match longer than min_len in a single pass.
+
+    Higher rank wins, then the shortest (prefer="min") or longest (prefer="max")
+    match; ties keep the earliest. A multi-line winner is cut to its longest line.
+    """
+    best = None
+    best_key = None
+    for raw in raws:
+        match = raw.strip()
+        length = len(match)
+        if length <= min_len:
+            continue
+        key = (rank(match, match.lower()) if rank else 0, -length if prefer == "min" else length)
+        if best_key is None or key > best_key:
+            best, best_key = match, key
+    if best is not None and "\n" in best:
+        best = max(best.split("\n"), key=len).strip()
+    return best
+
+# Light sharpening kernel applied after contrast equalization
+_SHARPEN_KERNEL = np.array([[0, -1, 0], [-1, 5, -1], [0, -1, 0]], dtype=np.float32)
+
+# Laplacian variance above which a page counts as crisp print that Tesseract handles
+_SHARP_TEXT_VARIANCE = 100.0
+
 class CertificateProcessor:
     """Main class for processing PDF certificates and extracting structured data."""
     
@@ -53,28 +210,48 @@ class CertificateProcessor:
         self.output_folder.mkdir(exist_ok=True)
         
         # Initialize OCR engines
-        self.tesseract_config = "--oem 3 --psm 6"
-        try:
-            self.easyocr_reader = easyocr.Reader(["en"], gpu=False)
-        except Exception as e:
-            logger.warning(f"EasyOCR initialization failed: {e}")
-            self.easyocr_reader = None
+        self.tesseract_config = "--oem 3 --psm 4 -c tessedit_do_invert=0"
+        self._qr = threading.local()
         
-        # Initialize spaCy model
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            logger.warning("spaCy model not found. Install with: python -m spacy download en_core_web_sm")
-            self.nlp = None
+        # Pooled HTTP session for QR URL verification
+        self._http = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+        self._http.headers['User-Agent'] = 'Certificate-Processor/1.0 (Verification Bot)'
         
         # Define extraction patterns
         self._init_patterns()
     
+    @property
+    def easyocr_reader(self):
+        """Shared EasyOCR reader, loaded on first use."""
+        return _get_easyocr()
+    
+    @property
+    def nlp(self):
+        """Shared spaCy model, loaded on first use."""
+        return _get_nlp()
+    
+    @property
+    def qr_detector(self):
+        """OpenCV QR detector, created on first use in each thread."""
+        detector = getattr(self._qr, "detector", None)
+        if detector is None:
+            detector = self._qr.detector = _lazy("cv2").QRCodeDetector()
+        return detector
+    
     def _init_patterns(self):
-        """Initialize regex patterns for extracting certificate information."""
+        """Initialize regex patterns for extracting certificate information.
+
+        Patterns are compiled once here so each document only pays for matching.
+        RE2 is used when installed; it runs in linear time and cannot backtrack
+        catastrophically on noisy OCR text. Flags are written inline because
+        google-re2 does not accept the stdlib flag constants.
+        """
         
         # University/Institution patterns
-        self.university_patterns = [
+        self.university_patterns = [pattern_re.compile('(?i)' + p) for p in [
             # Course completion and online providers
             r'(?:authorized by|offered by|in partnership with)\s+([A-Za-z\s,.-]+?)(?:\s+and offered through|\s+through|$|\n)',
             r'([A-Za-z\s,.-]+?)\s+(?:and offered through Coursera|via edX|on Udacity)(?:\s|$|,|\n)',
@@ -92,10 +269,10 @@ class CertificateProcessor:
             # Technical institutes
             r'(?:IIT|MIT|ITT|NIT)\s+([A-Za-z\s,.-]+?)(?:\s|$|,|\n)',
             r'([A-Za-z\s,.-]+?)\s+(?:Institute of Technology|Technical University)(?:\s|$|,|\n)',
-        ]
+        ]]
         
         # Degree/Course patterns
-        self.degree_patterns = [
+        self.degree_patterns = [pattern_re.compile('(?i)' + p) for p in [
             # Course completion patterns (prioritized for online courses)
             r'(?:has successfully completed|completed)\s+([A-Za-z\s,.-]+?)(?:\s+an online|\s+course|\s+program|$|\n)',
             r'(?:Certificate of Completion for|Certification in)\s+([A-Za-z\s,.-]+?)(?:\s|$|,|\n)',
@@ -113,44 +290,119 @@ class CertificateProcessor:
             # Online course patterns
             r'(?:Introduction to|Fundamentals of|Advanced|Complete|Professional)\s+([A-Za-z\s,.-]+?)(?:\s+Development|\s+Programming|\s+Course|\s+Certification|$|\n)',
             r'([A-Za-z\s,.-]+?)\s+(?:Development|Programming|Course|Certification|Specialization)(?:\s|$|,|\n)',
-        ]
+        ]]
         
-        # GPA patterns
-        self.gpa_patterns = [
+        # GPA patterns, in priority order: matches are collected pattern by pattern,
+        # so a GPA beats a CGPA and both beat a percentage wherever they appear
+        self.gpa_patterns = [pattern_re.compile('(?i)' + p) for p in [
             r'(?:GPA|Grade Point Average)[:\s]+(\d+\.?\d*)\s*(?:/\s*(\d+\.?\d*))?',
             r'(?:CGPA|Cumulative GPA)[:\s]+(\d+\.?\d*)\s*(?:/\s*(\d+\.?\d*))?',
             r'(?:Percentage|Percent|%)[:\s]*(\d+\.?\d*)\s*%?',
+        ]]
+        
+        # Date patterns in priority order, with the strptime format their matches
+        # follow (None: needs dateparser)
+        date_formats = [
+            (r'(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}', '%B %Y'),
+            (r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.?\s+\d{4}', '%b %Y'),
+            (r'\d{1,2}[/-]\d{1,2}[/-]\d{4}', '%m-%d-%Y'),
+            (r'\d{4}[/-]\d{1,2}[/-]\d{1,2}', '%Y-%m-%d'),
+            (r'(?:Conferred|Granted|Awarded|Issued).*?(\d{4})', None),
+            (r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},?\s+\d{4}', '%b %d %Y'),
         ]
         
-        # Date patterns
-        self.date_patterns = [
-            r'(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}',
-            r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.?\s+\d{4}',
-            r'\d{1,2}[/-]\d{1,2}[/-]\d{4}',
-            r'\d{4}[/-]\d{1,2}[/-]\d{1,2}',
-            r'(?:Conferred|Granted|Awarded|Issued).*?(\d{4})',
+        # Scanned pattern by pattern; only the "Conferred ..." form captures a group
+        self.date_patterns = [pattern_re.compile('(?i)' + p) for p, _ in date_formats]
+        self.date_parsers = [(re.compile(p, re.IGNORECASE), fmt) for p, fmt in date_formats if fmt]
+        
+        # Authenticity keywords, matched in one Aho-Corasick pass when available
+        self.verification_keywords = [
+            "verify", "verification", "authenticate", "digital", "certificate id",
+            "verification code", "license number", "registration number"
+        ]
+        self.known_institutions = [
+            "university", "college", "institute", "coursera", "edx", "udacity",
+            "meta", "google", "microsoft", "ibm", "amazon", "adobe"
         ]
+        self.keyword_automaton = None
+        if HAS_AHOCORASICK:
+            self.keyword_automaton = ahocorasick.Automaton()
+            for category, keywords in (("verification", self.verification_keywords),
+                                       ("institution", self.known_institutions)):
+                for keyword in keywords:
+                    self.keyword_automaton.add_word(keyword, (category, keyword))
+            self.keyword_automaton.make_automaton()
+    
+    def _find_keywords(self, text_lower: str) -> Tuple[List[str], List[str]]:
+        """Return the verification keywords and institutions present in the text, in list order."""
+        if self.keyword_automaton is None:
+            return ([kw for kw in self.verification_keywords if kw in text_lower],
+                    [inst for inst in self.known_institutions if inst in text_lower])
+        
+        hits = {"verification": set(), "institution": set()}
+        for _, (category, keyword) in self.keyword_automaton.iter(text_lower):
+            hits[category].add(keyword)
+        return ([kw for kw in self.verification_keywords if kw in hits["verification"]],
+                [inst for inst in self.known_institutions if inst in hits["institution"]])
+    
+    def _open_pdf(self, pdf_path: str, pdf=None):
+        """Open pdf_path, or reuse an already open handle without closing it."""
+        return nullcontext(pdf) if pdf is not None else fitz.open(pdf_path)
     
-    def extract_text_from_pdf(self, pdf_path: str) -> str:
-        """Extract text from PDF using pdfplumber and OCR fallback."""
+    def _render_page(self, page) -> np.ndarray:
+        """Rasterize a PyMuPDF page straight into a grayscale numpy array."""
+        # 200 dpi single-channel is enough for pyzbar and Tesseract and a third of the RGB bytes
+        pix = page.get_pixmap(dpi=200, colorspace=fitz.csGRAY)
+        return np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width)
+    
+    def extract_text_from_pdf(self, pdf_path: str, pdf=None) -> str:
+        """Extract text from PDF using PyMuPDF and OCR fallback."""
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                text = ""
-                for page in pdf.pages:
+            with self._open_pdf(pdf_path, pdf) as pdf:
+                page_texts = []
+                easyocr_pages = []
+                # OCR is independent per page, so fallback pages run on the OCR threads
+                # concurrently. They are rendered here, one at a time, because PyMuPDF
+                # documents are not thread-safe, and at most one rendered page per OCR
+                # thread is in flight.
+                in_flight = deque()
+                
+                def collect(index, future):
+                    ocr_result = future.result()
+                    if ocr_result is None:
+                        return
+                    img, ocr_text, tesseract_skipped = ocr_result
+                    page_texts[index] = ocr_text
+                    if not ocr_text:
+                        easyocr_pages.append((index, img, tesseract_skipped))
+                
+                for page in pdf:
                     # Try direct text extraction first
-                    page_text = page.extract_text()
+                    page_text = page.get_text("text")
                     if page_text and len(page_text.strip()) > 0:
-                        text += page_text + "\n"
-                    else:
-                        # Fallback to OCR if direct extraction fails
-                        try:
-                            img = page.to_image().original
-                            img = np.array(img)
-                            img = self._preprocess_image(img)
-                            ocr_text = self._extract_text_with_ocr(img)
-                            text += ocr_text + "\n"
-                        except Exception as ocr_error:
-                            logger.warning(f"OCR failed for page: {ocr_error}")
+                        page_texts.append(page_text)
+                        continue
+                    # Fallback to OCR if direct extraction fails
+                    try:
+                        in_flight.append((len(page_texts), _ocr_executor().submit(self._ocr_page, self._render_page(page))))
+                    except Exception as ocr_error:
+                        logger.warning(f"OCR failed for page: {ocr_error}")
+                    page_texts.append(None)
+                    if len(in_flight) >= _OCR_THREADS:
+                        collect(*in_flight.popleft())
+                while in_flight:
+                    collect(*in_flight.popleft())
+                
+                # Pages Tesseract could not read go through EasyOCR in one batch
+                if easyocr_pages:
+                    easyocr_texts = self._extract_text_with_easyocr([img for _, img, _ in easyocr_pages])
+                    for (index, img, tesseract_skipped), ocr_text in zip(easyocr_pages, easyocr_texts):
+                        # EasyOCR may be unavailable; skipped pages then still get Tesseract
+                        if not ocr_text and tesseract_skipped:
+                            ocr_text = self._extract_text_with_tesseract(img)
+                        page_texts[index] = ocr_text
+                
+                text = "".join(page_text + "\n" for page_text in page_texts if page_text is not None)
                 
             logger.info(f"Extracted {len(text)} characters from {pdf_path}")
             return text.strip()
@@ -159,48 +411,135 @@ class CertificateProcessor:
             logger.error(f"Failed to extract text from {pdf_path}: {e}")
             raise
     
+    def _ocr_page(self, img: np.ndarray) -> Optional[Tuple[np.ndarray, str, bool]]:
+        """Preprocess and Tesseract-OCR a single page, returning None if OCR fails.
+
+        Pages that don't look like crisp print skip Tesseract and come back with
+        empty text and the skipped flag set, so the caller sends them straight to
+        EasyOCR and falls back to Tesseract if that yields nothing.
+        """
+        try:
+            use_tesseract = self._prefers_tesseract(img)
+            img = self._preprocess_image(img)
+            return img, self._extract_text_with_tesseract(img) if use_tesseract else "", not use_tesseract
+        except Exception as ocr_error:
+            logger.warning(f"OCR failed for page: {ocr_error}")
+            return None
+    
     def _preprocess_image(self, image: np.ndarray) -> np.ndarray:
         """Preprocess image for better OCR results."""
+        cv2 = _lazy("cv2")
         try:
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
+            gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            # CLAHE evens out colored backgrounds before Otsu; the CLAHE object keeps
+            # scratch buffers, so each OCR thread gets its own
+            clahe = getattr(_ocr_local, "clahe", None)
+            if clahe is None:
+                clahe = _ocr_local.clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+            sharp = cv2.filter2D(clahe.apply(gray), -1, _SHARPEN_KERNEL)
+            thresh = cv2.threshold(sharp, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]
             return thresh
         except Exception:
             return image
     
+    def _prefers_tesseract(self, image: np.ndarray) -> bool:
+        """Cheap sharpness check: Tesseract for crisp print, EasyOCR for the rest."""
+        cv2 = _lazy("cv2")
+        try:
+            gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            return cv2.Laplacian(gray, cv2.CV_64F).var() > _SHARP_TEXT_VARIANCE
+        except Exception:
+            return True
+    
     def _extract_text_with_ocr(self, image: np.ndarray) -> str:
         """Extract text using OCR engines."""
-        text = ""
+        # Only skip Tesseract when the image looks blurry and EasyOCR can take it instead
+        use_tesseract = self._prefers_tesseract(image) or not self.easyocr_reader
+        text = self._extract_text_with_tesseract(image) if use_tesseract else ""
+        
+        # Fallback to EasyOCR if Tesseract was skipped, fails or produces no text
+        if not text:
+            text = self._extract_text_with_easyocr([image])[0]
         
-        # Try Tesseract first
+        # EasyOCR found nothing on a page Tesseract skipped; give Tesseract its turn
+        if not text and not use_tesseract:
+            text = self._extract_text_with_tesseract(image)
+        
+        return text
+    
+    def _tesserocr_api(self):
+        """Return this thread's preloaded Tesseract engine, shared by every processor in the process."""
+        api = getattr(_ocr_local, "tess_api", None)
+        if api is None:
+            api = _ocr_local.tess_api = PyTessBaseAPI(psm=PSM.SINGLE_COLUMN, oem=OEM.DEFAULT)
+            api.SetVariable("tessedit_do_invert", "0")
+        return api
+    
+    def _extract_text_with_tesseract(self, image: np.ndarray) -> str:
+        """Extract text using Tesseract, returning an empty string on failure."""
         try:
-            text = pytesseract.image_to_string(image, config=self.tesseract_config)
+            if HAS_TESSEROCR:
+                api = self._tesserocr_api()
+                api.SetImage(Image.fromarray(image))
+                return api.GetUTF8Text().strip()
+            return pytesseract.image_to_string(image, config=self.tesseract_config).strip()
         except Exception as e:
             logger.warning(f"Tesseract OCR failed: {e}")
+            return ""
+    
+    def _extract_text_with_easyocr(self, images: List[np.ndarray]) -> List[str]:
+        """Extract text from several images with batched EasyOCR calls.
+
+        readtext_batched needs equally sized inputs, so images are grouped by
+        shape rather than resized, which would distort portrait pages.
+        """
+        texts = [""] * len(images)
+        if not self.easyocr_reader:
+            return texts
+        
+        by_shape = {}
+        for index, image in enumerate(images):
+            by_shape.setdefault(image.shape, []).append(index)
         
-        # Fallback to EasyOCR if Tesseract fails or produces no text
-        if not text.strip() and self.easyocr_reader:
+        for indices in by_shape.values():
             try:
-                result = self.easyocr_reader.readtext(image)
-                text = " ".join([res[1] for res in result])
+                results = self.easyocr_reader.readtext_batched([images[i] for i in indices])
+                for index, result in zip(indices, results):
+                    texts[index] = " ".join([res[1] for res in result]).strip()
             except Exception as e:
                 logger.warning(f"EasyOCR failed: {e}")
         
-        return text.strip()
+        return texts
     
     def detect_qr_codes(self, image: np.ndarray) -> List[Dict[str, Any]]:
         """Detect and decode QR codes in the image."""
         qr_codes = []
         try:
-            decoded_objects = pyzbar.decode(image)
-            for obj in decoded_objects:
-                qr_data = {
-                    "type": obj.type,
-                    "data": obj.data.decode('utf-8'),
-                    "rect": obj.rect,
-                    "polygon": obj.polygon
-                }
-                qr_codes.append(qr_data)
+            # OpenCV finds and decodes every code in one call; pyzbar is the fallback
+            ok, decoded, points, _ = self.qr_detector.detectAndDecodeMulti(image)
+            if ok:
+                for data, corners in zip(decoded, points):
+                    if not data:
+                        continue
+                    x, y = corners.min(axis=0)
+                    w, h = corners.max(axis=0) - (x, y)
+                    qr_codes.append({
+                        "type": "QRCODE",
+                        "data": data,
+                        "rect": [int(x), int(y), int(w), int(h)],
+                        "polygon": corners.astype(int).tolist()
+                    })
+            
+            if not qr_codes:
+                for obj in _lazy("pyzbar.pyzbar").decode(image):
+                    qr_codes.append({
+                        "type": obj.type,
+                        "data": obj.data.decode('utf-8'),
+                        "rect": list(obj.rect),
+                        "polygon": [[p.x, p.y] for p in obj.polygon]
+                    })
+            
+            for qr_data in qr_codes:
                 logger.info(f"QR Code detected: {qr_data['data']}")
         except Exception as e:
             logger.warning(f"QR code detection failed: {e}")
@@ -225,22 +564,24 @@ class CertificateProcessor:
                 verification_result["error"] = "Invalid URL format"
                 return verification_result
             
-            # Make HTTP request with timeout
-            headers = {
-                'User-Agent': 'Certificate-Processor/1.0 (Verification Bot)'
-            }
-            response = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
-            
-            verification_result["accessible"] = True
-            verification_result["status_code"] = response.status_code
-            verification_result["content_type"] = response.headers.get('Content-Type', '')
-            
-            # Try to extract title from HTML response
-            if 'text/html' in verification_result["content_type"]:
-                import re
-                title_match = re.search(r'<title[^>]*>([^<]+)</title>', response.text, re.IGNORECASE)
-                if title_match:
-                    verification_result["title"] = title_match.group(1).strip()
+            # One streamed GET: the headers arrive first, and the body is only read
+            # for HTML pages, and then only as far as the title
+            with self._http.get(url, timeout=timeout, allow_redirects=True, stream=True) as response:
+                verification_result["accessible"] = True
+                verification_result["status_code"] = response.status_code
+                verification_result["content_type"] = response.headers.get('Content-Type', '')
+                
+                # Try to extract title from HTML response
+                if 'text/html' in verification_result["content_type"]:
+                    head = b""
+                    for chunk in response.iter_content(8192):
+                        head += chunk
+                        if b"</title>" in head.lower() or len(head) >= 65536:
+                            break
+                    page = head.decode(response.encoding or "utf-8", errors="replace")
+                    title_match = re.search(r'<title[^>]*>([^<]+)</title>', page, re.IGNORECASE)
+                    if title_match:
+                        verification_result["title"] = title_match.group(1).strip()
             
             logger.info(f"QR URL verified: {url} - Status: {response.status_code}")
             
@@ -253,7 +594,7 @@ class CertificateProcessor:
         
         return verification_result
     
-    def detect_digital_signatures(self, pdf_path: str) -> Dict[str, Any]:
+    def detect_digital_signatures(self, pdf_path: str, pdf=None) -> Dict[str, Any]:
         """Detect digital signatures and security features in PDF."""
         signature_info = {
             "has_digital_signature": False,
@@ -265,20 +606,20 @@ class CertificateProcessor:
         }
         
         try:
-            with pdfplumber.open(pdf_path) as pdf:
+            with self._open_pdf(pdf_path, pdf) as pdf:
                 # Check PDF metadata
                 if pdf.metadata:
                     signature_info["metadata"] = {
-                        "creator": pdf.metadata.get("Creator", ""),
-                        "producer": pdf.metadata.get("Producer", ""),
-                        "subject": pdf.metadata.get("Subject", ""),
-                        "author": pdf.metadata.get("Author", ""),
-                        "creation_date": str(pdf.metadata.get("CreationDate", "")),
-                        "modification_date": str(pdf.metadata.get("ModDate", ""))
+                        "creator": pdf.metadata.get("creator") or "",
+                        "producer": pdf.metadata.get("producer") or "",
+                        "subject": pdf.metadata.get("subject") or "",
+                        "author": pdf.metadata.get("author") or "",
+                        "creation_date": pdf.metadata.get("creationDate") or "",
+                        "modification_date": pdf.metadata.get("modDate") or ""
                     }
                 
                 # Check if PDF is encrypted
-                signature_info["encrypted"] = getattr(pdf.stream, 'isEncrypted', False)
+                signature_info["encrypted"] = pdf.is_encrypted
                 
                 # Look for common security indicators in metadata
                 producer = signature_info["metadata"].get("producer", "").lower()
@@ -294,8 +635,8 @@ class CertificateProcessor:
                         signature_info["security_features"].append(f"Signed with {keyword}")
                 
                 # Check for form fields (often used in digital signatures)
-                for page in pdf.pages:
-                    if hasattr(page, 'annots') and page.annots:
+                for page in pdf:
+                    if page.first_annot is not None:
                         signature_info["security_features"].append("Contains form annotations")
                         break
                 
@@ -312,14 +653,106 @@ class CertificateProcessor:
         try:
             with open(file_path, 'rb') as f:
                 file_hash = hashlib.sha256()
-                for chunk in iter(lambda: f.read(4096), b""):
-                    file_hash.update(chunk)
+                # mmap can't map an empty file
+                if os.fstat(f.fileno()).st_size == 0:
+                    return file_hash.hexdigest()
+                # Hash the whole mapping in one update instead of copying through read() buffers
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, "madvise"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    file_hash.update(mm)
                 return file_hash.hexdigest()
         except Exception as e:
             logger.warning(f"Hash calculation failed: {e}")
             return ""
     
-    def validate_certificate_authenticity(self, pdf_path: str, extracted_text: str) -> Dict[str, Any]:
+    def _verify_qr_urls(self, authenticity_report: Dict[str, Any]):
+        """Verify each distinct QR code URL in the report once, concurrently."""
+        qr_urls = list(dict.fromkeys(
+            qr["data"] for qr in authenticity_report["qr_codes"]
+            if qr["data"].startswith(("http://", "https://"))
+        ))
+        authenticity_report["qr_verification"] = []
+        if qr_urls:
+            with ThreadPoolExecutor(max_workers=min(len(qr_urls), 8)) as executor:
+                authenticity_report["qr_verification"].extend(executor.map(self.verify_qr_code_url, qr_urls))
+    
+    def _score_authenticity(self, authenticity_report: Dict[str, Any],
+                            found_keywords: List[str], found_institutions: List[str]):
+        """Derive the score, indicators, risk factors and recommendations from the findings."""
+        # Analyze authenticity indicators
+        authenticity_report["authenticity_indicators"] = []
+        authenticity_report["risk_factors"] = []
+        authenticity_report["recommendations"] = []
+        score = 0.0
+        
+        # QR code verification
+        if authenticity_report["qr_codes"]:
+            authenticity_report["authenticity_indicators"].append("Contains QR codes for verification")
+            score += 25
+        
+            verified_qr = sum(1 for qr in authenticity_report["qr_verification"] 
+                            if qr.get("accessible") and qr.get("status_code") == 200)
+            if verified_qr > 0:
+                authenticity_report["authenticity_indicators"].append(f"{verified_qr} QR code(s) successfully verified")
+                score += 25
+            else:
+                authenticity_report["risk_factors"].append("QR codes present but not accessible")
+        
+        # Digital signature analysis
+        if authenticity_report["digital_signatures"].get("security_features"):
+            authenticity_report["authenticity_indicators"].extend(
+                authenticity_report["digital_signatures"]["security_features"]
+            )
+            score += 20
+        
+        # Metadata analysis
+        metadata = authenticity_report["digital_signatures"].get("metadata", {})
+        if metadata.get("creator") or metadata.get("producer"):
+            authenticity_report["authenticity_indicators"].append("Contains creation metadata")
+            score += 10
+        
+        # Text-based indicators
+        if found_keywords:
+            authenticity_report["authenticity_indicators"].append(
+                f"Contains verification keywords: {', '.join(found_keywords)}"
+            )
+            score += len(found_keywords) * 2
+        
+        # Institution credibility check
+        if found_institutions:
+            authenticity_report["authenticity_indicators"].append(
+                f"Issued by recognized institutions: {', '.join(found_institutions)}"
+            )
+            score += 10
+        
+        # Risk factors
+        if not authenticity_report["qr_codes"] and not authenticity_report["digital_signatures"]["security_features"]:
+            authenticity_report["risk_factors"].append("No digital verification methods detected")
+        
+        if not metadata.get("creator") and not metadata.get("producer"):
+            authenticity_report["risk_factors"].append("Missing creation metadata")
+        
+        # Calculate overall score (max 100)
+        authenticity_report["overall_score"] = min(score, 100.0)
+        
+        # Generate recommendations
+        if authenticity_report["overall_score"] >= 80:
+            authenticity_report["recommendations"].append("High authenticity confidence - certificate appears genuine")
+        elif authenticity_report["overall_score"] >= 60:
+            authenticity_report["recommendations"].append("Moderate authenticity confidence - verify through additional means")
+        elif authenticity_report["overall_score"] >= 40:
+            authenticity_report["recommendations"].append("Low authenticity confidence - manual verification recommended")
+        else:
+            authenticity_report["recommendations"].append("Very low authenticity confidence - exercise caution")
+        
+        if authenticity_report["qr_verification"]:
+            for qr in authenticity_report["qr_verification"]:
+                if qr.get("accessible"):
+                    authenticity_report["recommendations"].append(f"Verify certificate at: {qr['url']}")
+    
+    def validate_certificate_authenticity(self, pdf_path: str, extracted_text: str, pdf=None,
+                                          document_hash: Optional[str] = None) -> Dict[str, Any]:
         """Comprehensive authenticity validation."""
         authenticity_report = {
             "overall_score": 0.0,
@@ -334,113 +767,24 @@ class CertificateProcessor:
         
         try:
             # Calculate document hash
-            authenticity_report["document_hash"] = self.calculate_document_hash(pdf_path)
-            
-            # Check for digital signatures
-            authenticity_report["digital_signatures"] = self.detect_digital_signatures(pdf_path)
+            authenticity_report["document_hash"] = document_hash or self.calculate_document_hash(pdf_path)
             
-            # Process PDF pages to look for QR codes
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages):
+            with self._open_pdf(pdf_path, pdf) as pdf:
+                # Check for digital signatures
+                authenticity_report["digital_signatures"] = self.detect_digital_signatures(pdf_path, pdf)
+                
+                # Process PDF pages to look for QR codes, rendering one page at a time
+                for page_num, page in enumerate(pdf):
                     try:
-                        # Convert page to image for QR detection
-                        img = page.to_image().original
-                        img_array = np.array(img)
-                        
                         # Detect QR codes
-                        qr_codes = self.detect_qr_codes(img_array)
-                        if qr_codes:
-                            authenticity_report["qr_codes"].extend(qr_codes)
-                            
-                            # Verify QR code URLs
-                            for qr in qr_codes:
-                                if qr["data"].startswith(("http://", "https://")):
-                                    verification = self.verify_qr_code_url(qr["data"])
-                                    authenticity_report["qr_verification"].append(verification)
+                        qr_codes = self.detect_qr_codes(self._render_page(page))
+                        authenticity_report["qr_codes"].extend(qr_codes)
                     
                     except Exception as e:
                         logger.warning(f"QR code detection failed for page {page_num}: {e}")
             
-            # Analyze authenticity indicators
-            score = 0.0
-            
-            # QR code verification
-            if authenticity_report["qr_codes"]:
-                authenticity_report["authenticity_indicators"].append("Contains QR codes for verification")
-                score += 25
-                
-                verified_qr = sum(1 for qr in authenticity_report["qr_verification"] 
-                                if qr.get("accessible") and qr.get("status_code") == 200)
-                if verified_qr > 0:
-                    authenticity_report["authenticity_indicators"].append(f"{verified_qr} QR code(s) successfully verified")
-                    score += 25
-                else:
-                    authenticity_report["risk_factors"].append("QR codes present but not accessible")
-            
-            # Digital signature analysis
-            if authenticity_report["digital_signatures"].get("security_features"):
-                authenticity_report["authenticity_indicators"].extend(
-                    authenticity_report["digital_signatures"]["security_features"]
-                )
-                score += 20
-            
-            # Metadata analysis
-            metadata = authenticity_report["digital_signatures"].get("metadata", {})
-            if metadata.get("creator") or metadata.get("producer"):
-                authenticity_report["authenticity_indicators"].append("Contains creation metadata")
-                score += 10
-            
-            # Text-based indicators
-            verification_keywords = [
-                "verify", "verification", "authenticate", "digital", "certificate id",
-                "verification code", "license number", "registration number"
-            ]
-            
-            text_lower = extracted_text.lower()
-            found_keywords = [kw for kw in verification_keywords if kw in text_lower]
-            if found_keywords:
-                authenticity_report["authenticity_indicators"].append(
-                    f"Contains verification keywords: {', '.join(found_keywords)}"
-                )
-                score += len(found_keywords) * 2
-            
-            # Institution credibility check
-            known_institutions = [
-                "university", "college", "institute", "coursera", "edx", "udacity",
-                "meta", "google", "microsoft", "ibm", "amazon", "adobe"
-            ]
-            
-            found_institutions = [inst for inst in known_institutions if inst in text_lower]
-            if found_institutions:
-                authenticity_report["authenticity_indicators"].append(
-                    f"Issued by recognized institutions: {', '.join(found_institutions)}"
-                )
-                score += 10
-            
-            # Risk factors
-            if not authenticity_report["qr_codes"] and not authenticity_report["digital_signatures"]["security_features"]:
-                authenticity_report["risk_factors"].append("No digital verification methods detected")
-            
-            if not metadata.get("creator") and not metadata.get("producer"):
-                authenticity_report["risk_factors"].append("Missing creation metadata")
-            
-            # Calculate overall score (max 100)
-            authenticity_report["overall_score"] = min(score, 100.0)
-            
-            # Generate recommendations
-            if authenticity_report["overall_score"] >= 80:
-                authenticity_report["recommendations"].append("High authenticity confidence - certificate appears genuine")
-            elif authenticity_report["overall_score"] >= 60:
-                authenticity_report["recommendations"].append("Moderate authenticity confidence - verify through additional means")
-            elif authenticity_report["overall_score"] >= 40:
-                authenticity_report["recommendations"].append("Low authenticity confidence - manual verification recommended")
-            else:
-                authenticity_report["recommendations"].append("Very low authenticity confidence - exercise caution")
-            
-            if authenticity_report["qr_verification"]:
-                for qr in authenticity_report["qr_verification"]:
-                    if qr.get("accessible"):
-                        authenticity_report["recommendations"].append(f"Verify certificate at: {qr['url']}")
+            self._verify_qr_urls(authenticity_report)
+            self._score_authenticity(authenticity_report, *self._find_keywords(extracted_text.lower()))
             
         except Exception as e:
             authenticity_report["error"] = str(e)
@@ -450,27 +794,50 @@ class CertificateProcessor:
     
     def extract_entities_with_spacy(self, text: str) -> Dict[str, List[str]]:
         """Extract entities using spaCy NLP."""
-        entities = {"universities": [], "organizations": [], "persons": []}
-        
         if not self.nlp:
-            return entities
+            return {"universities": [], "organizations": [], "persons": []}
         
         try:
-            doc = self.nlp(text)
-            for ent in doc.ents:
-                if ent.label_ in ["ORG"]:
-                    # Check if it looks like a university
-                    if any(word in ent.text.lower() for word in ["university", "college", "institute", "school"]):
-                        entities["universities"].append(ent.text)
-                    else:
-                        entities["organizations"].append(ent.text)
-                elif ent.label_ == "PERSON":
-                    entities["persons"].append(ent.text)
+            return self._entities_from_doc(self.nlp(text))
         except Exception as e:
             logger.warning(f"spaCy processing failed: {e}")
+            return {"universities": [], "organizations": [], "persons": []}
+    
+    def extract_entities_batch(self, texts: List[str]) -> List[Dict[str, List[str]]]:
+        """Extract entities from many certificate texts with a single nlp.pipe pass."""
+        if not self.nlp:
+            return [{"universities": [], "organizations": [], "persons": []} for _ in texts]
         
+        try:
+            return [self._entities_from_doc(doc) for doc in self.nlp.pipe(texts, batch_size=32)]
+        except Exception as e:
+            logger.warning(f"spaCy processing failed: {e}")
+            return [{"universities": [], "organizations": [], "persons": []} for _ in texts]
+    
+    def _entities_from_doc(self, doc) -> Dict[str, List[str]]:
+        entities = {"universities": [], "organizations": [], "persons": []}
+        for ent in doc.ents:
+            if ent.label_ in ["ORG"]:
+                # Check if it looks like a university
+                if any(word in ent.text.lower() for word in ["university", "college", "institute", "school"]):
+                    entities["universities"].append(ent.text)
+                else:
+                    entities["organizations"].append(ent.text)
+            elif ent.label_ == "PERSON":
+                entities["persons"].append(ent.text)
         return entities
     
+    def _parse_known_date(self, date_str: str) -> Optional[datetime]:
+        """Parse a date whose layout a date pattern already fixed, without dateparser."""
+        for date_rx, fmt in self.date_parsers:
+            if date_rx.fullmatch(date_str):
+                normalized = " ".join(date_str.replace(",", " ").replace(".", " ").split()).replace("/", "-")
+                try:
+                    return datetime.strptime(normalized, fmt)
+                except ValueError:
+                    return None
+        return None
+    
     def extract_certificate_info(self, text: str) -> Dict[str, Any]:
         """Extract structured information from certificate text."""
         result = {
@@ -490,26 +857,15 @@ class CertificateProcessor:
         # Extract university/institution
         university_matches = []
         for pattern in self.university_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = pattern.findall(text)
             university_matches.extend(matches)
         
         result["raw_matches"]["university"] = university_matches
         
         if university_matches:
-            # Filter and choose the best match
-            filtered_matches = [match.strip() for match in university_matches if len(match.strip()) > 2]
-            if filtered_matches:
-                # Prefer specific company/institution names over generic text
-                priority_matches = [m for m in filtered_matches if m in ["Meta", "Google", "IBM", "Microsoft", "Amazon", "Facebook", "Apple"]]
-                if priority_matches:
-                    best_match = priority_matches[0]
-                else:
-                    # Prefer shorter, cleaner matches for university names
-                    best_match = min(filtered_matches, key=len).strip()
-                    # Clean up common issues
-                    if "\n" in best_match:
-                        lines = best_match.split("\n")
-                        best_match = max(lines, key=len).strip()
+            # Prefer specific company/institution names, then shorter, cleaner matches
+            best_match = _best(university_matches, 2, rank=_university_rank, prefer="min")
+            if best_match is not None:
                 result["university"] = best_match
                 result["confidence_scores"]["university"] = 0.8 if len(best_match) > 3 else 0.6
                 result["extraction_methods"]["university"] = "regex"
@@ -527,40 +883,21 @@ class CertificateProcessor:
         # Extract degree/course
         degree_matches = []
         for pattern in self.degree_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = pattern.findall(text)
             degree_matches.extend(matches)
         
         result["raw_matches"]["degree"] = degree_matches
         
         if degree_matches:
-            # Filter and choose the best match
-            filtered_matches = [match.strip() for match in degree_matches if len(match.strip()) > 3]
-            if filtered_matches:
-                # Prefer full course names over partial matches
-                course_matches = [m for m in filtered_matches if any(word in m.lower() for word in ["introduction", "development", "science", "engineering", "certificate", "diploma", "bachelor", "master"])]
-                if course_matches:
-                    # Choose the one that contains "Introduction to" or similar course indicators
-                    intro_matches = [m for m in course_matches if "introduction" in m.lower()]
-                    if intro_matches:
-                        best_match = max(intro_matches, key=len).strip()
-                    else:
-                        best_match = max(course_matches, key=len).strip()
-                else:
-                    best_match = max(filtered_matches, key=len).strip()
-                    
-                # Clean up common issues
-                if "\n" in best_match:
-                    lines = best_match.split("\n")
-                    best_match = max(lines, key=len).strip()
+            # Prefer "Introduction to ..." and other full course names, then the longest match
+            best_match = _best(degree_matches, 3, rank=_degree_rank, prefer="max")
+            if best_match is not None:
                 result["degree"] = best_match
                 result["confidence_scores"]["degree"] = 0.8 if len(best_match) > 10 else 0.6
                 result["extraction_methods"]["degree"] = "regex"
         
         # Extract GPA
-        gpa_matches = []
-        for pattern in self.gpa_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            gpa_matches.extend([match[0] if isinstance(match, tuple) else match for match in matches])
+        gpa_matches = [match.group(1) for pattern in self.gpa_patterns for match in pattern.finditer(text)]
         
         result["raw_matches"]["gpa"] = gpa_matches
         
@@ -574,14 +911,8 @@ class CertificateProcessor:
                 pass
         
         # Extract graduation date
-        date_matches = []
-        for pattern in self.date_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            date_matches.extend(matches)
-        
-        # Also look for simple date patterns
-        simple_dates = re.findall(r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},?\s+\d{4}', text, re.IGNORECASE)
-        date_matches.extend(simple_dates)
+        date_matches = [match.group(match.lastindex or 0)
+                        for pattern in self.date_patterns for match in pattern.finditer(text)]
         
         result["raw_matches"]["graduation_date"] = date_matches
         
@@ -589,8 +920,11 @@ class CertificateProcessor:
             # Try to parse the date
             best_date = None
             for date_str in date_matches:
+                # Anything without a digit can't carry the year we need
+                if len(date_str) < 4 or not any(c.isdigit() for c in date_str):
+                    continue
                 try:
-                    parsed_date = dateparser.parse(str(date_str))
+                    parsed_date = self._parse_known_date(date_str) or _parse_date(date_str)
                     if parsed_date:
                         best_date = parsed_date.strftime("%B %Y")
                         break
@@ -625,15 +959,40 @@ class CertificateProcessor:
         
         logger.info(f"Processing file: {filename}")
         
-        # Extract text from PDF
-        text = self.extract_text_from_pdf(str(file_path))
+        output_path = self.output_folder / f"{file_path.stem}_extracted.json"
         
-        # Extract certificate information
-        cert_info = self.extract_certificate_info(text)
+        # Results are cached under the document hash, so a re-submitted PDF skips OCR/NLP/HTTP
+        # entirely; no cache is used if hashing failed
+        doc_hash = self.calculate_document_hash(str(file_path))
+        cache_path = self.output_folder / f"{doc_hash}.v{PARSER_VERSION}.json" if doc_hash else None
+        if cache_path is not None and cache_path.exists():
+            logger.info(f"Using cached results for {filename}: {cache_path}")
+            cert_info = orjson.loads(cache_path.read_bytes())
+            # Only the document-derived findings are cached; QR URLs are verified again
+            # and the score rebuilt, so a briefly unreachable URL isn't remembered
+            found_keywords, found_institutions = cert_info.pop("keyword_hits")
+            authenticity = cert_info["authenticity"]
+            self._verify_qr_urls(authenticity)
+            self._score_authenticity(authenticity, found_keywords, found_institutions)
+            cert_info["source_file"] = filename
+            cert_info["processed_at"] = datetime.now().isoformat()
+            # The per-file output still has to exist so is_up_to_date skips this file next run;
+            # unlink first in case an older run left it hardlinked to a cache entry
+            output_path.unlink(missing_ok=True)
+            output_path.write_bytes(orjson.dumps(cert_info, option=orjson.OPT_INDENT_2))
+            return cert_info
         
-        # Perform authenticity validation
-        logger.info(f"Validating authenticity for: {filename}")
-        authenticity = self.validate_certificate_authenticity(str(file_path), text)
+        # Open the PDF once and share the handle across all passes
+        with fitz.open(file_path) as pdf:
+            # Extract text from PDF
+            text = self.extract_text_from_pdf(str(file_path), pdf)
+            
+            # Extract certificate information
+            cert_info = self.extract_certificate_info(text)
+            
+            # Perform authenticity validation
+            logger.info(f"Validating authenticity for: {filename}")
+            authenticity = self.validate_certificate_authenticity(str(file_path), text, pdf, doc_hash)
         cert_info["authenticity"] = authenticity
         
         # Add metadata
@@ -642,36 +1001,285 @@ class CertificateProcessor:
         cert_info["text_length"] = len(text)
         
         # Save results to output folder
-        output_filename = f"{file_path.stem}_extracted.json"
-        output_path = self.output_folder / output_filename
+        output_path.unlink(missing_ok=True)
+        output_path.write_bytes(orjson.dumps(cert_info, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(cert_info, f, indent=2, ensure_ascii=False)
+        # Cache the network-independent result with the keyword hits the score needs.
+        # The per-run fields are left out, and failed validations aren't cached.
+        if cache_path is not None and "error" not in authenticity:
+            cached = dict(cert_info, authenticity=dict(authenticity, qr_verification=[]),
+                          keyword_hits=self._find_keywords(text.lower()))
+            del cached["source_file"], cached["processed_at"]
+            cache_path.write_bytes(orjson.dumps(cached, option=orjson.OPT_SERIALIZE_NUMPY))
         
         logger.info(f"Results saved to: {output_path}")
         logger.info(f"Authenticity score: {authenticity.get('overall_score', 0):.1f}/100")
         
         return cert_info
     
-    def process_all_files(self) -> List[Dict[str, Any]]:
-        """Process all PDF files in the upload folder."""
-        results = []
-        pdf_files = list(self.upload_folder.glob("*.pdf"))
+    def warmup(self):
+        """Load the lazily imported dependencies and spaCy now, e.g. in a new pool worker.
+
+        The EasyOCR reader is still created on first use, so workers that never need it
+        don't pay for loading the model.
+        """
+        for name in ("cv2", "pyzbar.pyzbar", "dateparser", "easyocr"):
+            _lazy(name)
+        _get_nlp()
+        # dateparser loads its English data on the first parse
+        _parse_date("January 2020")
+    
+    def list_pdf_files(self) -> List[str]:
+        """Return the names of the PDF files in the upload folder."""
+        # scandir hands back names and cached file types without building Path objects
+        with os.scandir(self.upload_folder) as entries:
+            return [entry.name for entry in entries if entry.is_file() and entry.name.lower().endswith(".pdf")]
+    
+    def is_up_to_date(self, filename: str) -> bool:
+        """Whether filename already has an extraction result at least as new as the PDF."""
+        output_path = os.path.join(self.output_folder, f"{Path(filename).stem}_extracted.json")
+        try:
+            return os.path.getmtime(output_path) >= os.path.getmtime(os.path.join(self.upload_folder, filename))
+        except OSError:
+            return False
+    
+    def process_file_to_disk(self, filename: str) -> str:
+        """Process a file, leaving the result only in the output folder; returns its status."""
+        self.process_file(filename)
+        return "processed"
+    
+    def process_all_files(self, executor_type: str = "process", force: bool = False,
+                          jobs: Optional[int] = None) -> Counter:
+        """Process all PDF files in the upload folder.
+
+        Results are written to the output folder by whoever processes each file;
+        only a Counter of "processed", "failed" and "skipped" files comes back.
+        executor_type "process" suits CPU-bound OCR; "thread" shares this processor
+        and avoids pickling when the time goes to file reads and network checks.
+        Files whose results are already up to date are skipped unless force is set.
+        jobs caps the pool size; None keeps the executor's default.
+        """
+        statuses = Counter()
+        pdf_files = self.list_pdf_files()
         
         if not pdf_files:
             logger.warning(f"No PDF files found in {self.upload_folder}")
-            return results
+            return statuses
         
-        for pdf_file in pdf_files:
-            try:
-                result = self.process_file(pdf_file.name)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Failed to process {pdf_file.name}: {e}")
+        if not force:
+            pending = [filename for filename in pdf_files if not self.is_up_to_date(filename)]
+            statuses["skipped"] = len(pdf_files) - len(pending)
+            if statuses["skipped"]:
+                logger.info("Skipping %d already processed files (use --force to redo them).", statuses["skipped"])
+            pdf_files = pending
+            if not pdf_files:
+                return statuses
+        
+        if jobs is not None:
+            jobs = max(1, jobs)
+        
+        workers = jobs or os.cpu_count()
+        if executor_type == "thread":
+            executor = ThreadPoolExecutor(max_workers=jobs or min(32, 4 * (os.cpu_count() or 1)))
+            process = self.process_file_to_disk
+        else:
+            # Files are independent; each worker process builds and warms up its own
+            # processor once. Workers are spawned, not forked: this process may already
+            # hold torch/OpenMP state and OCR threads, and forking those can deadlock.
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(str(self.upload_folder), str(self.output_folder), workers),
+            )
+            process = _process_one
         
-        logger.info(f"Processing complete. Processed {len(results)} files successfully.")
+        with executor:
+            futures = {executor.submit(process, filename): filename for filename in pdf_files}
+            # Collect in completion order so one slow PDF doesn't hold back the rest
+            safe_status = self._safe_status
+            statuses.update(safe_status(future, futures[future]) for future in as_completed(futures))
         
-        return results
+        logger.info("Processing complete. Processed %d files successfully.", statuses["processed"])
+        
+        return statuses
+    
+    @staticmethod
+    def _safe_status(future, filename: str) -> str:
+        """Return a finished job's status, logging why it failed if it did."""
+        try:
+            return future.result()
+        except Exception as e:
+            # Lazy %-formatting: the message is only built if the record is emitted
+            logger.error("Failed to process %s: %s", filename, e)
+            return "failed"
+
+# Per-process processor used by process_all_files workers
+_worker_processor = None
+
+def _init_worker(upload_folder: str, output_folder: str, workers: int):
+    """Create and warm up one processor per worker process, so its models load once."""
+    global _worker_processor
+    _share_ocr_threads(workers)
+    _worker_processor = CertificateProcessor(upload_folder, output_folder)
+    _worker_processor.warmup()
+
+def _process_one(filename: str) -> str:
+    # Only the short status crosses back to the parent; the result is already on disk
+    return _worker_processor.process_file_to_disk(filename)
+
+def _json_bytes(result: Dict[str, Any]) -> bytes:
+    return orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+
+def _write_bytes(data: bytes):
+    """Write raw bytes to stdout after any pending text, without forcing a flush."""
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # prompt_toolkit's stdout proxy only takes text
+        sys.stdout.write(data.decode("utf-8"))
+    else:
+        buffer.write(data)
+
+def _print_json(result: Dict[str, Any]):
+    """Write a result to stdout as indented JSON, encoded straight to bytes by orjson."""
+    _write_bytes(_json_bytes(result))
+
+def _run_interactive(processor: CertificateProcessor, jobs: Optional[int] = None):
+    """Read commands until quit, processing queued files in the background."""
+    print("Certificate Processor - Interactive Mode")
+    print("Commands:")
+    print("  file <filename>  - Queue a specific file for processing")
+    print("  wait             - Wait for queued files and show their results")
+    print("  all              - Process all files in upload folder")
+    print("  batch <listfile> - Process the files named in listfile, one per line")
+    print("  quit             - Exit")
+    
+    # Files are processed in the background so more can be queued while they run
+    queued = {}
+    job_ids = itertools.count(1)
+    executor = ThreadPoolExecutor(max_workers=max(1, jobs) if jobs is not None else os.cpu_count())
+    
+    def run_batch(filenames: List[str]):
+        # Results go straight to the output folder; the futures only hold a status
+        futures = {executor.submit(processor.process_file_to_disk, filename): filename for filename in filenames}
+        processed = 0
+        for done, future in enumerate(as_completed(futures), 1):
+            try:
+                future.result()
+                processed += 1
+                print(f"[{done}/{len(futures)}] {futures[future]}", flush=True)
+            except Exception as e:
+                print(f"[{done}/{len(futures)}] {futures[future]} failed: {e}", flush=True)
+        print(f"Processed {processed} files.")
+    
+    # Each handler takes the command arguments and returns False to leave the loop
+    def handle_file(args: List[str]) -> bool:
+        if not args:
+            return handle_unknown(args)
+        job_id = next(job_ids)
+        queued[job_id] = (args[0], executor.submit(processor.process_file, args[0]))
+        print(f"Queued job {job_id}: {args[0]}")
+        return True
+    
+    def handle_wait(args: List[str]) -> bool:
+        # Gather every job's output and write it in one go
+        chunks = []
+        # Snapshot the queue: with the async prompt, files can be queued while this waits
+        for job_id, (filename, future) in list(queued.items()):
+            del queued[job_id]
+            try:
+                result = future.result()
+                chunks.append(f"Job {job_id} ({filename}):\n".encode())
+                chunks.append(_json_bytes(result))
+            except Exception as e:
+                chunks.append(f"Job {job_id} ({filename}) failed: {e}\n".encode())
+        _write_bytes(b"".join(chunks))
+        return True
+    
+    def handle_all(args: List[str]) -> bool:
+        run_batch(sorted(processor.list_pdf_files()))
+        return True
+    
+    def handle_batch(args: List[str]) -> bool:
+        if not args:
+            return handle_unknown(args)
+        with open(args[0], encoding="utf-8") as f:
+            filenames = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+        run_batch(filenames)
+        return True
+    
+    def handle_quit(args: List[str]) -> bool:
+        return False
+    
+    def handle_unknown(args: List[str]) -> bool:
+        print("Invalid command. Use 'file <filename>', 'wait', 'all', 'batch <listfile>', or 'quit'")
+        return True
+    
+    handlers = {
+        "file": handle_file,
+        "wait": handle_wait,
+        "all": handle_all,
+        "batch": handle_batch,
+        "quit": handle_quit,
+    }
+    
+    # Commands that block until files finish; the async prompt runs them off the event loop
+    blocking = {"wait", "all", "batch"}
+    
+    def run_handler(handler, args: List[str]):
+        try:
+            handler(args)
+        except Exception as e:
+            print(f"Error: {e}")
+    
+    async def prompt_loop():
+        session = PromptSession()
+        loop = asyncio.get_running_loop()
+        pending = set()
+        # patch_stdout keeps output from background commands from breaking the prompt line
+        with patch_stdout():
+            while True:
+                try:
+                    command = (await session.prompt_async("> ")).strip().split()
+                except (KeyboardInterrupt, EOFError):
+                    print("Exiting...")
+                    break
+                if not command:
+                    continue
+                if command[0] == "quit":
+                    break
+                handler = handlers.get(command[0], handle_unknown)
+                if command[0] in blocking:
+                    task = loop.run_in_executor(None, run_handler, handler, command[1:])
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+                else:
+                    run_handler(handler, command[1:])
+            if pending:
+                await asyncio.gather(*pending)
+    
+    try:
+        if HAS_PROMPT_TOOLKIT and sys.stdin.isatty():
+            asyncio.run(prompt_loop())
+        else:
+            while True:
+                try:
+                    command = input("\n> ").strip().split()
+                    if not command:
+                        continue
+                    if not handlers.get(command[0], handle_unknown)(command[1:]):
+                        break
+                
+                except KeyboardInterrupt:
+                    print("\nExiting...")
+                    break
+                except Exception as e:
+                    print(f"Error: {e}")
+    finally:
+        # Let queued files finish before exiting
+        executor.shutdown(wait=True)
+        sys.stdout.flush()
 
 def main():
     """Main function for command-line interface."""
@@ -680,6 +1288,13 @@ def main():
     parser.add_argument("--all", action="store_true", help="Process all files in upload folder")
     parser.add_argument("--upload-folder", type=str, default="upload", help="Upload folder path")
     parser.add_argument("--output-folder", type=str, default="output", help="Output folder path")
+    parser.add_argument("--executor", choices=["process", "thread"], default="process",
+                        help="Pool used by --all: process for CPU-bound OCR, thread for I/O-bound batches")
+    parser.add_argument("--profile", action="store_true", help="Report wall time and CPU time for --all")
+    parser.add_argument("--jobs", "-j", type=int, default=None,
+                        help="Number of files processed at once (default: CPU count; 4x CPU count, at most 32, "
+                             "for --executor thread). Values below 1 are treated as 1")
+    parser.add_argument("--force", action="store_true", help="Reprocess files that already have up-to-date results")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     
     args = parser.parse_args()
@@ -694,44 +1309,31 @@ def main():
         if args.file:
             # Process single file
             result = processor.process_file(args.file)
-            print(json.dumps(result, indent=2, ensure_ascii=False))
+            _print_json(result)
         
         elif args.all:
+            # Batch runs are not watched line by line, so block-buffer stdout; the
+            # interactive mode keeps line buffering so its replies show immediately
+            sys.stdout.reconfigure(line_buffering=False, write_through=False)
+            
             # Process all files
-            results = processor.process_all_files()
-            print(f"Processed {len(results)} files.")
+            wall_start, cpu_start = time.perf_counter(), os.times()
+            statuses = processor.process_all_files(args.executor, force=args.force, jobs=args.jobs)
+            print(f"Processed {statuses['processed']} files "
+                  f"({statuses['failed']} failed, {statuses['skipped']} already up to date).")
             print("Check the output folder for detailed results.")
+            
+            if args.profile:
+                # Children times include the pool workers once they have been joined
+                wall = time.perf_counter() - wall_start
+                cpu_end = os.times()
+                cpu = sum(cpu_end[:4]) - sum(cpu_start[:4])
+                print(f"Wall time: {wall:.2f}s, CPU time: {cpu:.2f}s ({cpu / max(wall, 1e-9) / (os.cpu_count() or 1):.0%} of all cores)")
+                print("High CPU usage favours --executor process; low usage means I/O waits, try --executor thread.")
         
         else:
             # Interactive mode
-            print("Certificate Processor - Interactive Mode")
-            print("Commands:")
-            print("  file <filename>  - Process a specific file")
-            print("  all              - Process all files in upload folder")
-            print("  quit             - Exit")
-            
-            while True:
-                try:
-                    command = input("\n> ").strip().split()
-                    if not command:
-                        continue
-                    
-                    if command[0] == "quit":
-                        break
-                    elif command[0] == "file" and len(command) > 1:
-                        result = processor.process_file(command[1])
-                        print(json.dumps(result, indent=2, ensure_ascii=False))
-                    elif command[0] == "all":
-                        results = processor.process_all_files()
-                        print(f"Processed {len(results)} files.")
-                    else:
-                        print("Invalid command. Use 'file <filename>', 'all', or 'quit'")
-                
-                except KeyboardInterrupt:
-                    print("\nExiting...")
-                    break
-                except Exception as e:
-                    print(f"Error: {e}")
+            _run_interactive(processor, args.jobs)
     
     except Exception as e:
         logger.error(f"Application error: {e}")
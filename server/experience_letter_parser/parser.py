@@ -1,16 +1,28 @@
+import os
 import pdfplumber
 import docx
 import pytesseract
 from PIL import Image
 import re
+import copy
+import functools
+import hashlib
+import io
 import json
-import os
+import mmap
+import multiprocessing
+import shutil
+import subprocess
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Logging is configured by whoever runs the parser: main() for the CLI, the host app otherwise
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
 logger = logging.getLogger(__name__)
 
 # Optional imports with fallbacks
@@ -21,60 +33,221 @@ except ImportError:
     HAS_DATEPARSER = False
     logger.warning("dateparser not available, using basic date parsing")
 
+# rapidfuzz is a compiled drop-in for fuzzywuzzy's extractOne/WRatio
 try:
-    from fuzzywuzzy import fuzz, process
+    from rapidfuzz import fuzz, process
     HAS_FUZZYWUZZY = True
 except ImportError:
-    HAS_FUZZYWUZZY = False
-    logger.warning("fuzzywuzzy not available, using exact matching")
+    try:
+        from fuzzywuzzy import fuzz, process
+        HAS_FUZZYWUZZY = True
+    except ImportError:
+        HAS_FUZZYWUZZY = False
+        logger.warning("rapidfuzz/fuzzywuzzy not available, using exact matching")
+
+# OpenCV for page clean-up before OCR; pages go to Tesseract as-is without it
+try:
+    import cv2
+    import numpy as np
+    HAS_CV2 = True
+except ImportError:
+    HAS_CV2 = False
+
+# Compiled JSON encoder for the per-letter output files
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Multi-pattern automaton for the common job title scan
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# In-process Tesseract API; avoids a tesseract subprocess and model load per image
+try:
+    from tesserocr import PyTessBaseAPI, PSM, OEM
+    HAS_TESSEROCR = True
+except ImportError:
+    HAS_TESSEROCR = False
+
+# Linear-time regex engine for the extraction patterns; no pattern here needs
+# backtracking-only features, so RE2 is a drop-in when installed. google-re2
+# has no stdlib flag constants, so the patterns carry their flags inline.
+try:
+    import re2 as pattern_re
+    HAS_RE2 = True
+except ImportError:
+    pattern_re = re
+    HAS_RE2 = False
 
 # Check for Tesseract installation and configure
+# Last successful probe, so worker processes and restarts skip the subprocess round-trip
+_TESSERACT_CACHE = Path.home() / '.cache' / 'docparse' / 'tesseract_path.json'
+
+def _tesseract_version(cmd):
+    """Return the first line of `tesseract --version`, or None if cmd can't run."""
+    try:
+        proc = subprocess.run([cmd, '--version'], capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if proc.returncode != 0:
+        return None
+    # Older releases print the version banner to stderr
+    output = (proc.stdout or proc.stderr).strip()
+    return output.splitlines()[0] if output else 'unknown'
+
 def check_tesseract_installation():
     """Check if Tesseract is available and try to configure it."""
     try:
-        # Try default pytesseract
-        pytesseract.image_to_string(Image.new('RGB', (100, 30), color='white'))
-        return True
-    except Exception as e:
-        if "tesseract is not installed" in str(e).lower() or "not found" in str(e).lower():
-            # Common Windows installation paths
-            common_paths = [
-                r'C:\Program Files\Tesseract-OCR\tesseract.exe',
-                r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe',
-                r'C:\Tesseract-OCR\tesseract.exe',
-                r'C:\Tools\Tesseract-OCR\tesseract.exe'
-            ]
-            
-            for path in common_paths:
-                if os.path.exists(path):
-                    pytesseract.pytesseract.tesseract_cmd = path
-                    logger.info(f"Found Tesseract at: {path}")
-                    try:
-                        pytesseract.image_to_string(Image.new('RGB', (100, 30), color='white'))
-                        return True
-                    except:
-                        continue
-                        
-            logger.warning("Tesseract OCR not found in common locations.")
-            logger.warning("Please install from: https://github.com/UB-Mannheim/tesseract/wiki")
-            logger.warning("Or set pytesseract.pytesseract.tesseract_cmd to the correct path")
-            return False
-        else:
-            logger.warning(f"Tesseract test failed: {e}")
-            return False
+        cached = json.loads(_TESSERACT_CACHE.read_text(encoding='utf-8'))
+        if cached.get('available') and os.path.isfile(cached.get('cmd', '')):
+            pytesseract.pytesseract.tesseract_cmd = cached['cmd']
+            return True
+    except (OSError, ValueError):
+        pass
+    
+    # Common Windows installation paths
+    common_paths = [
+        r'C:\Program Files\Tesseract-OCR\tesseract.exe',
+        r'C:\Program Files (x86)\Tesseract-OCR\tesseract.exe',
+        r'C:\Tesseract-OCR\tesseract.exe',
+        r'C:\Tools\Tesseract-OCR\tesseract.exe'
+    ]
+    
+    for path in [shutil.which(pytesseract.pytesseract.tesseract_cmd)] + common_paths:
+        if not path or not os.path.isfile(path):
+            continue
+        version = _tesseract_version(path)
+        if version:
+            pytesseract.pytesseract.tesseract_cmd = path
+            logger.info(f"Found Tesseract at: {path} ({version})")
+            try:
+                _TESSERACT_CACHE.parent.mkdir(parents=True, exist_ok=True)
+                _TESSERACT_CACHE.write_text(json.dumps({"available": True, "cmd": path, "version": version}), encoding='utf-8')
+            except OSError as e:
+                logger.warning(f"Could not cache Tesseract location: {e}")
+            return True
+    
+    logger.warning("Tesseract OCR not found in common locations.")
+    logger.warning("Please install from: https://github.com/UB-Mannheim/tesseract/wiki")
+    logger.warning("Or set pytesseract.pytesseract.tesseract_cmd to the correct path")
+    return False
 
 # Check Tesseract on startup
 TESSERACT_AVAILABLE = check_tesseract_installation()
 
-def extract_text_from_pdf(file_path):
+# Configure pytesseract for better accuracy
+TESSERACT_CONFIG = r'--oem 3 --psm 6'
+
+_tess = threading.local()
+
+def _tesserocr_api():
+    """Return this thread's Tesseract engine, loaded once and reused for every image."""
+    api = getattr(_tess, "api", None)
+    if api is None:
+        api = _tess.api = PyTessBaseAPI(lang='eng', psm=PSM.SINGLE_BLOCK, oem=OEM.DEFAULT)
+    return api
+
+def _ocr_image(image):
+    """Run Tesseract on a PIL image, through the persistent API when tesserocr is installed."""
+    if HAS_TESSEROCR:
+        api = _tesserocr_api()
+        api.SetImage(image)
+        return api.GetUTF8Text()
+    return pytesseract.image_to_string(image, config=TESSERACT_CONFIG)
+
+# Deskewing is opt-in (LETTER_DESKEW=1); most uploads are straight and need no rotation
+DESKEW = os.environ.get('LETTER_DESKEW', '').lower() in ('1', 'true', 'yes')
+
+def _skew_angle(binary):
+    """Median tilt of the page's text lines in degrees, or 0 when too few lines are found.
+
+    Only long, thin blobs count, so logos, signatures and scan borders can't tilt the estimate.
+    """
+    # Smear characters sideways so each text line becomes one blob
+    ink = cv2.dilate(255 - binary, cv2.getStructuringElement(cv2.MORPH_RECT, (25, 3)))
+    contours, _ = cv2.findContours(ink, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    min_length = binary.shape[1] / 8
+    angles = []
+    for contour in contours:
+        _, (width, height), angle = cv2.minAreaRect(contour)
+        if width < height:
+            width, height = height, width
+            angle -= 90
+        if width < min_length or width < 5 * height:
+            continue
+        # Fold to the long side's tilt from horizontal
+        while angle > 45:
+            angle -= 90
+        while angle <= -45:
+            angle += 90
+        angles.append(angle)
+    return float(np.median(angles)) if len(angles) >= 3 else 0.0
+
+def _preprocess_image(image):
+    """Binarize a page for OCR: grayscale and adaptive threshold, plus deskew when enabled."""
+    if not HAS_CV2:
+        return image
+    gray = np.asarray(image.convert('L'))
+    binary = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 10)
+    
+    # Only small angles are corrected so a sparse page is never turned sideways
+    if DESKEW:
+        angle = _skew_angle(binary)
+        if 0.5 < abs(angle) < 15:
+            height, width = binary.shape
+            matrix = cv2.getRotationMatrix2D((width / 2, height / 2), angle, 1.0)
+            binary = cv2.warpAffine(binary, matrix, (width, height), flags=cv2.INTER_NEAREST, borderValue=255)
+    return Image.fromarray(binary)
+
+# OCR text keyed by a digest of the page pixels, so identical pages (shared
+# letterheads, re-scans, duplicate uploads) handled by this process are read once
+_OCR_CACHE = OrderedDict()
+_OCR_CACHE_SIZE = 512
+_ocr_cache_lock = threading.Lock()
+
+def _ocr_batch(images):
+    """OCR an iterable of PIL images through this thread's engine, reusing cached page text.
+
+    Images are consumed one at a time, so a generator keeps a single page in memory.
+    """
+    texts = []
+    for image in images:
+        digest = hashlib.blake2b(f"{image.mode}{image.size}".encode(), digest_size=16)
+        digest.update(image.tobytes())
+        key = digest.digest()
+        
+        with _ocr_cache_lock:
+            text = _OCR_CACHE.get(key)
+            if text is not None:
+                _OCR_CACHE.move_to_end(key)
+        
+        if text is None:
+            text = _ocr_image(_preprocess_image(image))
+            with _ocr_cache_lock:
+                _OCR_CACHE[key] = text
+                if len(_OCR_CACHE) > _OCR_CACHE_SIZE:
+                    _OCR_CACHE.popitem(last=False)
+        texts.append(text)
+    return texts
+
+def extract_text_from_pdf(file_path, source=None):
     """Extract text from PDF files using pdfplumber with OCR fallback."""
     try:
-        with pdfplumber.open(file_path) as pdf:
-            text = ""
+        with pdfplumber.open(source or file_path) as pdf:
+            parts = []
             for page in pdf.pages:
+                # Image-only pages have no character objects; skip the text layout pass
+                if not page.chars:
+                    continue
                 page_text = page.extract_text()
                 if page_text:
-                    text += page_text + "\n"
+                    parts.append(page_text)
+            text = "\n".join(parts)
             
             # If no text was extracted, try OCR on the PDF pages
             if not text.strip():
@@ -83,22 +256,15 @@ def extract_text_from_pdf(file_path):
                     return None
                     
                 logger.info(f"No selectable text found in {file_path}, attempting OCR...")
+                parts = []
                 try:
-                    from PIL import Image
-                    import io
-                    
-                    with pdfplumber.open(file_path) as pdf:
-                        for page_num, page in enumerate(pdf.pages):
-                            # Convert PDF page to image
-                            page_image = page.within_bbox(page.bbox).to_image(resolution=300)
-                            
-                            # Convert to PIL Image and apply OCR
-                            pil_image = page_image.original
-                            page_text = pytesseract.image_to_string(pil_image, config='--oem 3 --psm 6')
-                            
-                            if page_text.strip():
-                                text += page_text + "\n"
-                                logger.info(f"OCR extracted {len(page_text)} characters from page {page_num + 1}")
+                    # Render each page in grayscale at 200 dpi, enough for Tesseract, only
+                    # as the batch reaches it rather than holding every page at once
+                    images = (page.to_image(resolution=200).original.convert('L') for page in pdf.pages)
+                    for page_num, page_text in enumerate(_ocr_batch(images)):
+                        if page_text.strip():
+                            parts.append(page_text)
+                            logger.info(f"OCR extracted {len(page_text)} characters from page {page_num + 1}")
                 
                 except Exception as ocr_error:
                     if "tesseract is not installed" in str(ocr_error).lower() or "not found" in str(ocr_error).lower():
@@ -107,6 +273,7 @@ def extract_text_from_pdf(file_path):
                         logger.error("After installation, add Tesseract to your PATH or set TESSDATA_PREFIX")
                     else:
                         logger.warning(f"OCR failed for {file_path}: {ocr_error}")
+                text = "\n".join(parts)
             
             return text.strip() if text.strip() else None
             
@@ -114,123 +281,199 @@ def extract_text_from_pdf(file_path):
         logger.error(f"Error reading PDF {file_path}: {e}")
         return None
 
-def extract_text_from_docx(file_path):
+def _docx_lines(doc):
+    """Yield non-blank paragraph texts, reading each paragraph's text only once."""
+    for para in doc.paragraphs:
+        para_text = para.text
+        if para_text and not para_text.isspace():
+            yield para_text
+
+def extract_text_from_docx(file_path, source=None):
     """Extract text from DOCX files using python-docx."""
     try:
-        doc = docx.Document(file_path)
-        text = "\n".join([para.text for para in doc.paragraphs if para.text.strip()])
+        doc = docx.Document(source or file_path)
+        text = "\n".join(_docx_lines(doc))
         return text.strip()
     except Exception as e:
         logger.error(f"Error reading DOCX {file_path}: {e}")
         return None
 
-def extract_text_from_doc(file_path):
+def extract_text_from_doc(file_path, source=None):
     """Extract text from DOC files - fallback to OCR."""
     try:
         # For .doc files, try docx first then fallback to OCR
-        return extract_text_from_docx(file_path)
+        return extract_text_from_docx(file_path, source)
     except Exception as e:
         logger.warning(f"DOC format {file_path} not supported directly, trying OCR: {e}")
-        return extract_text_from_image(file_path)
+        return extract_text_from_image(file_path, source)
 
-def extract_text_from_image(file_path):
+def extract_text_from_image(file_path, source=None):
     """Extract text from images using pytesseract."""
     if not TESSERACT_AVAILABLE:
         logger.error(f"OCR not available for image {file_path}")
         return None
         
     try:
-        # Configure pytesseract for better accuracy
-        custom_config = r'--oem 3 --psm 6'
-        text = pytesseract.image_to_string(Image.open(file_path), config=custom_config)
+        with Image.open(source or file_path) as image:
+            text = _ocr_batch([image])[0]
         return text.strip()
     except Exception as e:
         logger.error(f"Error reading image {file_path}: {e}")
         return None
 
+# Curly quotes to their ASCII forms, applied in a single translate pass
+_CLEAN_TABLE = str.maketrans({'\u201c': '"', '\u201d': '"', '\u2018': "'", '\u2019': "'"})
+_WS_RE = re.compile(r'\s+')
+
 def clean_text(text):
     """Clean and normalize text for better parsing."""
     if not text:
         return ""
     
     # Remove excessive whitespace and normalize
-    text = re.sub(r'\s+', ' ', text)
-    # Fix common OCR errors
-    text = text.replace('|', 'I').replace('0', 'O') if text.startswith('0') else text
+    text = _WS_RE.sub(' ', text)
     # Normalize quotes and special characters
-    text = text.replace('"', '"').replace('"', '"').replace(''', "'").replace(''', "'")
+    text = text.translate(_CLEAN_TABLE)
     
     return text.strip()
 
-def extract_dates_from_text(text):
+# Extraction patterns, compiled once at import instead of on every call
+# Multiple date patterns for different formats
+_DATE_PATTERNS = [pattern_re.compile('(?i)' + p) for p in (
+    r'\b(\d{1,2})[\/\-.](\d{1,2})[\/\-.](\d{4})\b',  # DD/MM/YYYY or MM/DD/YYYY
+    r'\b(\d{4})[\/\-.](\d{1,2})[\/\-.](\d{1,2})\b',  # YYYY/MM/DD
+    r'\b([A-Za-z]{3,12})\s+(\d{1,2}),?\s+(\d{4})\b',  # Month DD, YYYY
+    r'\b(\d{1,2})\s+([A-Za-z]{3,12})\s+(\d{4})\b',    # DD Month YYYY
+    r'\b([A-Za-z]{3,12})\s+(\d{4})\b',                # Month YYYY
+    r'\b(\d{1,2})[a-z]{2}\s+([A-Za-z]{3,12})\s+(\d{4})\b',  # 1st January 2020
+)]
+
+_ORG_PATTERNS = [pattern_re.compile('(?im)' + p) for p in (
+    # Standard patterns
+    r'employed\s+(?:with|at|by)\s+([A-Za-z][A-Za-z\s&.,()0-9]+?)(?:\s+(?:as|from|since|during))',
+    r'working\s+(?:with|at|for)\s+([A-Za-z][A-Za-z\s&.,()0-9]+?)(?:\s+(?:as|from|since))',
+    r'(?:company|organization|employer)[\s:]+([A-Za-z][A-Za-z\s&.,()0-9]+?)(?:\s+(?:as|from|\.|\n))',
+    r'([A-Za-z][A-Za-z\s&.,()0-9]+?)\s+(?:pvt\.?\s*ltd\.?|ltd\.?|inc\.?|corp\.?|llc|limited)',
+    
+    # Template-specific patterns
+    r'(?:^|\n)([A-Z][A-Za-z\s&.,()0-9]+?)\s*\n.*(?:experience|employment|letter)',
+    r'letterhead[:\s]*([A-Za-z][A-Za-z\s&.,()0-9]+)',
+    r'from[:\s]*([A-Za-z][A-Za-z\s&.,()0-9]+?)(?:\s+(?:to|regarding))',
+    
+    # More flexible patterns
+    r'certify\s+that\s+[A-Za-z\s]+\s+(?:was\s+)?(?:employed|worked|served)\s+(?:with|at|for|by)\s+([A-Za-z][A-Za-z\s&.,()0-9]+?)(?:\s+(?:as|from))',
+    r'(?:this\s+)?(?:is\s+to\s+)?(?:certify|confirm)\s+that\s+[A-Za-z\s]+\s+(?:was\s+)?(?:employed|worked)\s+(?:with|at)\s+([A-Za-z][A-Za-z\s&.,()0-9]+)',
+    
+    # Header patterns for templates
+    r'^([A-Z][A-Za-z\s&.,()0-9]{5,50})\s*$',  # Company name as header
+)]
+
+# Run against the lowercased text; the result is title-cased either way
+_TITLE_PATTERNS = [pattern_re.compile(p) for p in (
+    # Most specific patterns first
+    r'employed\s+with\s+[A-Za-z\s&.,()0-9]+?\s+as\s+(?:a\s+)?([A-Za-z][A-Za-z\s\-/&]+?)(?:\s+from)',
+    r'employed\s+[A-Za-z\s&.,()0-9]+?\s+as\s+(?:a\s+)?([A-Za-z][A-Za-z\s\-/&]+?)(?:\s+from)',
+    r'working\s+as\s+(?:a\s+)?([A-Za-z][A-Za-z\s\-/&]+?)(?:\s+(?:with|at|from))',
+    r'(?:as|position|title|designation|role)[\s:]+(?:a\s+)?([A-Za-z][A-Za-z\s\-/&]+?)(?:\s+(?:from|with|at|during|\.|,))',
+    r'position\s+of\s+([A-Za-z][A-Za-z\s\-/&]+?)(?:\s+(?:from|with|at))',
+    r'(?:served|worked)\s+as\s+(?:a\s+)?([A-Za-z][A-Za-z\s\-/&]+?)(?:\s+(?:from|with|at))',
+)]
+
+_NAME_PATTERNS = [pattern_re.compile('(?is)' + p) for p in (
+    # Standard patterns
+    r'(?:that|certify that|mr\.?\s*|ms\.?\s*|mrs\.?\s*)([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)',
+    r'employee[\s:]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)',
+    r'(?:name|person)[\s:]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)',
+    r'([A-Z][a-z]+\s+[A-Z][a-z]+)(?:\s+was\s+employed|\s+worked|\s+has\s+been)',
+    
+    # Template-specific patterns
+    r'employee\s+name[:\s]*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)',
+    r'name\s+of\s+employee[:\s]*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)',
+    r'(?:mr|ms|mrs)\.?\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\s+(?:was|is|has)',
+    
+    # More flexible patterns; gaps are bounded so a failed match can't rescan
+    # the rest of the letter from every preamble occurrence
+    r'(?:to\s+whom\s+it\s+may\s+concern.{0,500}?)([A-Z][a-z]+\s+[A-Z][a-z]+)(?:\s+(?:was|is|has))',
+    r'(?:this\s+is\s+to\s+certify.{0,500}?)([A-Z][a-z]+\s+[A-Z][a-z]+)(?:\s+(?:was|is|has))',
+    
+    # Fallback: Look for capitalized names near employment keywords
+    r'(?:employ|work|serv)(?:ed|ing).{0,500}?([A-Z][a-z]+\s+[A-Z][a-z]+)',
+)]
+
+# Manager name patterns
+_MANAGER_NAME_PATTERNS = [pattern_re.compile('(?i)' + p) for p in (
+    r'(?:manager|supervisor|reporting\s+to|signed\s+by|approved\s+by)[\s:]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
+    r'(?:hr\s+manager|human\s+resources)[\s:]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
+)]
+
+_EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+_PHONE_RE = re.compile(r'[\+]?[\d\s\-\(\)]{10,15}')
+# Keyword patterns below are matched against the lowercased text, so need no IGNORECASE
+_DURATION_RE = re.compile(r'(\d+(?:\.\d+)?)\s*years?')
+_FROM_TO_RE = re.compile(r'from\s+([a-z0-9\s,/.-]+?)\s+to\s+([a-z0-9\s,/.-]+)')
+_START_KW_RE = re.compile(r'\b(?:from|since|joined|started)\b')
+_END_KW_RE = re.compile(r'\b(?:to|until|till|ended|left|relieved)\b')
+_ORG_SANITIZE_RE = re.compile(r'[^\w\s&.,()-]')
+
+_DATE_FORMATS = (
+    '%d/%m/%Y', '%m/%d/%Y', '%Y/%m/%d', 
+    '%d-%m-%Y', '%m-%d-%Y', '%Y-%m-%d',
+    '%B %d, %Y', '%d %B %Y', '%B %Y',
+    '%b %d, %Y', '%d %b %Y', '%b %Y'
+)
+
+@functools.lru_cache(maxsize=2048)
+def _parse_date(date_str):
+    """Parse a date string once per distinct value: fixed formats first, then dateparser."""
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    
+    if HAS_DATEPARSER:
+        try:
+            return dateparser.parse(date_str)
+        except Exception:
+            pass
+    return None
+
+def extract_dates_from_text(text, text_lower=None):
     """Extract all possible dates from text using multiple patterns."""
+    if text_lower is None:
+        text_lower = text.lower()
     dates_found = []
     
-    # Multiple date patterns for different formats
-    date_patterns = [
-        r'\b(\d{1,2})[\/\-.](\d{1,2})[\/\-.](\d{4})\b',  # DD/MM/YYYY or MM/DD/YYYY
-        r'\b(\d{4})[\/\-.](\d{1,2})[\/\-.](\d{1,2})\b',  # YYYY/MM/DD
-        r'\b([A-Za-z]{3,12})\s+(\d{1,2}),?\s+(\d{4})\b',  # Month DD, YYYY
-        r'\b(\d{1,2})\s+([A-Za-z]{3,12})\s+(\d{4})\b',    # DD Month YYYY
-        r'\b([A-Za-z]{3,12})\s+(\d{4})\b',                # Month YYYY
-        r'\b(\d{1,2})[a-z]{2}\s+([A-Za-z]{3,12})\s+(\d{4})\b',  # 1st January 2020
-    ]
-    
-    for pattern in date_patterns:
-        matches = re.finditer(pattern, text, re.IGNORECASE)
+    for pattern in _DATE_PATTERNS:
+        matches = pattern.finditer(text)
         for match in matches:
             date_str = match.group(0)
-            # Use dateparser if available, otherwise fallback parsing
-            parsed_date = None
-            
-            if HAS_DATEPARSER:
-                try:
-                    import dateparser
-                    parsed_date = dateparser.parse(date_str)
-                except:
-                    pass
-            
-            if not parsed_date:
-                # Fallback manual date parsing
-                date_formats = [
-                    '%d/%m/%Y', '%m/%d/%Y', '%Y/%m/%d', 
-                    '%d-%m-%Y', '%m-%d-%Y', '%Y-%m-%d',
-                    '%B %d, %Y', '%d %B %Y', '%B %Y',
-                    '%b %d, %Y', '%d %b %Y', '%b %Y'
-                ]
-                
-                for fmt in date_formats:
-                    try:
-                        parsed_date = datetime.strptime(date_str, fmt)
-                        break
-                    except ValueError:
-                        continue
+            parsed_date = _parse_date(date_str)
             
             if parsed_date:
-                # Determine the context of this date
-                context_before = text[max(0, match.start()-50):match.start()].lower()
-                context_after = text[match.start():min(len(text), match.end()+50)].lower()
+                # Determine the context of this date: 50 characters either side,
+                # searched in place without slicing the text
+                start = match.start()
+                context_start = max(0, start - 50)
+                context_end = match.end() + 50
                 
                 date_type = 'unknown'
                 
                 # Skip document dates (at the beginning)
-                if match.start() < 100 and ('date:' in context_before or match.start() < 50):
+                if start < 100 and (start < 50 or 'date:' in text_lower[context_start:start]):
                     date_type = 'document_date'
                 # Look for employment start indicators
-                elif any(keyword in context_before + context_after for keyword in 
-                        ['from', 'since', 'joined', 'started', 'employed from', 'worked from']):
+                elif _START_KW_RE.search(text_lower, context_start, context_end):
                     date_type = 'start_date'
                 # Look for employment end indicators  
-                elif any(keyword in context_before + context_after for keyword in 
-                        ['to', 'until', 'till', 'ended', 'left', 'relieved']):
+                elif _END_KW_RE.search(text_lower, context_start, context_end):
                     date_type = 'end_date'
                 
                 dates_found.append({
                     'raw': date_str,
                     'parsed': parsed_date,
-                    'position': match.start(),
-                    'type': date_type,
-                    'context': context_before + " [DATE] " + context_after
+                    'position': start,
+                    'type': date_type
                 })
     
     # Sort by position in text
@@ -239,33 +482,12 @@ def extract_dates_from_text(text):
 
 def extract_organization_name(text):
     """Extract organization name using multiple strategies."""
-    patterns = [
-        # Standard patterns
-        r'employed\s+(?:with|at|by)\s+([A-Za-z][A-Za-z\s&.,()0-9]+?)(?:\s+(?:as|from|since|during))',
-        r'working\s+(?:with|at|for)\s+([A-Za-z][A-Za-z\s&.,()0-9]+?)(?:\s+(?:as|from|since))',
-        r'(?:company|organization|employer)[\s:]+([A-Za-z][A-Za-z\s&.,()0-9]+?)(?:\s+(?:as|from|\.|\n))',
-        r'([A-Za-z][A-Za-z\s&.,()0-9]+?)\s+(?:pvt\.?\s*ltd\.?|ltd\.?|inc\.?|corp\.?|llc|limited)',
-        
-        # Template-specific patterns
-        r'(?:^|\n)([A-Z][A-Za-z\s&.,()0-9]+?)\s*\n.*(?:experience|employment|letter)',
-        r'letterhead[:\s]*([A-Za-z][A-Za-z\s&.,()0-9]+)',
-        r'from[:\s]*([A-Za-z][A-Za-z\s&.,()0-9]+?)(?:\s+(?:to|regarding))',
-        
-        # More flexible patterns
-        r'certify\s+that\s+[A-Za-z\s]+\s+(?:was\s+)?(?:employed|worked|served)\s+(?:with|at|for|by)\s+([A-Za-z][A-Za-z\s&.,()0-9]+?)(?:\s+(?:as|from))',
-        r'(?:this\s+)?(?:is\s+to\s+)?(?:certify|confirm)\s+that\s+[A-Za-z\s]+\s+(?:was\s+)?(?:employed|worked)\s+(?:with|at)\s+([A-Za-z][A-Za-z\s&.,()0-9]+)',
-        
-        # Header patterns for templates
-        r'^([A-Z][A-Za-z\s&.,()0-9]{5,50})\s*$',  # Company name as header
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+    for pattern in _ORG_PATTERNS:
+        match = pattern.search(text)
         if match:
             org_name = match.group(1).strip()
-            # Clean up common artifacts
-            org_name = re.sub(r'\s+', ' ', org_name)
-            org_name = re.sub(r'[^\w\s&.,()-]', '', org_name)
+            # Clean up common artifacts; whitespace is already collapsed by clean_text
+            org_name = _ORG_SANITIZE_RE.sub('', org_name)
             
             # Skip if it's too short, too long, or contains template words
             if (len(org_name) > 3 and len(org_name) < 100 and 
@@ -274,93 +496,69 @@ def extract_organization_name(text):
     
     return None
 
-def extract_job_title(text):
+_COMMON_TITLES = (
+    'software engineer', 'developer', 'analyst', 'manager', 'director', 
+    'consultant', 'specialist', 'executive', 'coordinator', 'administrator',
+    'qa engineer', 'tester', 'project manager', 'team lead', 'architect',
+    'designer', 'marketing manager', 'sales executive', 'hr manager', 
+    'finance manager', 'accountant', 'data scientist', 'business analyst',
+    'qa analyst', 'quality analyst', 'test engineer', 'senior developer',
+    'marketing executive', 'software developer', 'senior analyst',
+    'operations engineer', 'academic counselor', 'system administrator'
+)
+_COMMON_TITLES_LC = tuple(t.lower() for t in _COMMON_TITLES)
+_TITLES_LC_SET = frozenset(_COMMON_TITLES_LC)
+
+if HAS_AHOCORASICK:
+    _TITLES_AC = ahocorasick.Automaton()
+    for _i, _title in enumerate(_COMMON_TITLES_LC):
+        _TITLES_AC.add_word(_title, (_i, _title))
+    _TITLES_AC.make_automaton()
+
+def _longest_common_title(title_lower):
+    """Return the longest common title occurring in title_lower, in one automaton pass."""
+    if HAS_AHOCORASICK:
+        return max((t for _, (_, t) in _TITLES_AC.iter(title_lower)), key=len, default=None)
+    return max((t for t in _COMMON_TITLES_LC if t in title_lower), key=len, default=None)
+
+def extract_job_title(text, text_lower=None):
     """Extract job title using patterns and fuzzy matching."""
-    common_titles = [
-        'software engineer', 'developer', 'analyst', 'manager', 'director', 
-        'consultant', 'specialist', 'executive', 'coordinator', 'administrator',
-        'qa engineer', 'tester', 'project manager', 'team lead', 'architect',
-        'designer', 'marketing manager', 'sales executive', 'hr manager', 
-        'finance manager', 'accountant', 'data scientist', 'business analyst',
-        'qa analyst', 'quality analyst', 'test engineer', 'senior developer',
-        'marketing executive', 'software developer', 'senior analyst',
-        'operations engineer', 'academic counselor', 'system administrator'
-    ]
-    
-    patterns = [
-        # Most specific patterns first
-        r'employed\s+with\s+[A-Za-z\s&.,()0-9]+?\s+as\s+(?:a\s+)?([A-Za-z][A-Za-z\s\-/&]+?)(?:\s+from)',
-        r'employed\s+[A-Za-z\s&.,()0-9]+?\s+as\s+(?:a\s+)?([A-Za-z][A-Za-z\s\-/&]+?)(?:\s+from)',
-        r'working\s+as\s+(?:a\s+)?([A-Za-z][A-Za-z\s\-/&]+?)(?:\s+(?:with|at|from))',
-        r'(?:as|position|title|designation|role)[\s:]+(?:a\s+)?([A-Za-z][A-Za-z\s\-/&]+?)(?:\s+(?:from|with|at|during|\.|,))',
-        r'position\s+of\s+([A-Za-z][A-Za-z\s\-/&]+?)(?:\s+(?:from|with|at))',
-        r'(?:served|worked)\s+as\s+(?:a\s+)?([A-Za-z][A-Za-z\s\-/&]+?)(?:\s+(?:from|with|at))',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    if text_lower is None:
+        text_lower = text.lower()
+    for pattern in _TITLE_PATTERNS:
+        match = pattern.search(text_lower)
         if match:
-            title = match.group(1).strip()
-            title = re.sub(r'\s+', ' ', title)
+            # Whitespace is already collapsed by clean_text, and the match is lowercase
+            title = title_lower = match.group(1).strip()
             
-            # Clean up common artifacts
-            title = re.sub(r'\s+', ' ', title).strip()
+            # Cheapest checks first: exact match is a single set probe
+            if title_lower in _TITLES_LC_SET:
+                return title_lower.title()
             
-            # Use fuzzy matching if available
-            if HAS_FUZZYWUZZY:
-                try:
-                    from fuzzywuzzy import process
-                    best_match = process.extractOne(title.lower(), common_titles)
-                    if best_match and best_match[1] > 70:  # 70% similarity threshold
-                        return best_match[0].title()
-                except:
-                    pass
-            
-            # Simple matching fallback
-            title_lower = title.lower()
-            
-            # First try exact match
-            for common_title in common_titles:
-                if common_title.lower() == title_lower:
+            # Then try partial match only if no exact match found
+            common_title = _longest_common_title(title_lower)
+            if common_title and len(common_title) > 3:
+                # Only use partial match if it's a significant portion
+                if len(common_title) / len(title) > 0.7:
                     return common_title.title()
             
-            # Then try partial match only if no exact match found
-            for common_title in common_titles:
-                if common_title.lower() in title_lower and len(common_title) > 3:
-                    # Only use partial match if it's a significant portion
-                    if len(common_title) / len(title) > 0.7:
-                        return common_title.title()
+            # Use fuzzy matching if available
+            if HAS_FUZZYWUZZY:
+                # 70% similarity threshold
+                best_match = process.extractOne(title_lower, _COMMON_TITLES_LC, scorer=fuzz.WRatio, score_cutoff=70)
+                if best_match:
+                    return best_match[0].title()
             
             # Return the extracted title if it's reasonable and not a generic word
-            if len(title) > 2 and len(title) < 50 and not title.lower() in ['employed', 'working', 'position', 'job']:
+            if len(title) > 2 and len(title) < 50 and not title_lower in ['employed', 'working', 'position', 'job']:
                 return title.title()
     
     return None
 
 def extract_employee_name(text):
     """Extract employee name from the letter with enhanced patterns."""
-    patterns = [
-        # Standard patterns
-        r'(?:that|certify that|mr\.?\s*|ms\.?\s*|mrs\.?\s*)([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)',
-        r'employee[\s:]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)',
-        r'(?:name|person)[\s:]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)',
-        r'([A-Z][a-z]+\s+[A-Z][a-z]+)(?:\s+was\s+employed|\s+worked|\s+has\s+been)',
-        
-        # Template-specific patterns
-        r'employee\s+name[:\s]*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)',
-        r'name\s+of\s+employee[:\s]*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)',
-        r'(?:mr|ms|mrs)\.?\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\s+(?:was|is|has)',
-        
-        # More flexible patterns
-        r'(?:to\s+whom\s+it\s+may\s+concern.*?)([A-Z][a-z]+\s+[A-Z][a-z]+)(?:\s+(?:was|is|has))',
-        r'(?:this\s+is\s+to\s+certify.*?)([A-Z][a-z]+\s+[A-Z][a-z]+)(?:\s+(?:was|is|has))',
-        
-        # Fallback: Look for capitalized names near employment keywords
-        r'(?:employ|work|serv)(?:ed|ing).*?([A-Z][a-z]+\s+[A-Z][a-z]+)',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+    for pattern in _NAME_PATTERNS:
+        match = pattern.search(text)
         if match:
             name = match.group(1).strip()
             # Check if it's a valid name (at least 2 words, not too long, not common words)
@@ -380,29 +578,29 @@ def extract_manager_info(text):
         'manager_contact': None
     }
     
-    # Manager name patterns
-    name_patterns = [
-        r'(?:manager|supervisor|reporting\s+to|signed\s+by|approved\s+by)[\s:]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-        r'(?:hr\s+manager|human\s+resources)[\s:]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-    ]
-    
-    for pattern in name_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _MANAGER_NAME_PATTERNS:
+        match = pattern.search(text)
         if match:
             manager_info['manager_name'] = match.group(1).strip()
             break
     
     # Manager contact (email/phone)
-    email_match = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text)
+    email_match = _EMAIL_RE.search(text)
     if email_match:
         manager_info['manager_contact'] = email_match.group(0)
     
-    phone_match = re.search(r'[\+]?[\d\s\-\(\)]{10,15}', text)
+    phone_match = _PHONE_RE.search(text)
     if phone_match and not email_match:
         manager_info['manager_contact'] = phone_match.group(0).strip()
     
     return manager_info
 
+# Parse results keyed by a digest of the cleaned text, so repeated template
+# letters skip the extraction pipeline
+_PARSE_CACHE = OrderedDict()
+_PARSE_CACHE_SIZE = 256
+_parse_cache_lock = threading.Lock()
+
 def parse_letter(text):
     """Parse experience letter text to extract details and check consistency."""
     if not text:
@@ -410,7 +608,34 @@ def parse_letter(text):
 
     # Clean the text first
     cleaned_text = clean_text(text)
+    key = hashlib.blake2b(cleaned_text.encode('utf-8'), digest_size=16).digest()
     
+    with _parse_cache_lock:
+        result = _PARSE_CACHE.get(key)
+        if result is not None:
+            _PARSE_CACHE.move_to_end(key)
+    
+    if result is None:
+        result = _parse_cleaned_text(cleaned_text)
+        with _parse_cache_lock:
+            _PARSE_CACHE[key] = result
+            if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+    
+    # Callers annotate the result, so never hand out the cached dict itself
+    return copy.deepcopy(result)
+
+def _has_range_hint(text_lower):
+    """Check for 'from ... to' or 'since ... until' with two finds instead of a backtracking regex."""
+    for first, second in (('from', 'to'), ('since', 'until')):
+        pos = text_lower.find(first)
+        if pos != -1 and text_lower.find(second, pos + len(first)) != -1:
+            return True
+    return False
+
+def _parse_cleaned_text(cleaned_text):
+    """Run the extractors over already-cleaned letter text."""
+    cleaned_text_lower = cleaned_text.lower()
     result = {
         "extracted_data": {},
         "formatting_consistency": {},
@@ -420,15 +645,16 @@ def parse_letter(text):
 
     try:
         # Extract all information using the new robust functions
-        dates = extract_dates_from_text(cleaned_text)
+        dates = extract_dates_from_text(cleaned_text, cleaned_text_lower)
         org_name = extract_organization_name(cleaned_text)
-        job_title = extract_job_title(cleaned_text)
+        job_title = extract_job_title(cleaned_text, cleaned_text_lower)
         employee_name = extract_employee_name(cleaned_text)
         manager_info = extract_manager_info(cleaned_text)
         
         # Determine start and end dates with better logic
-        start_date = None
-        end_date = None
+        # Chosen dates stay datetimes until output; only the calendar date is used
+        start_dt = None
+        end_dt = None
         duration_years = None
         
         # Filter out document dates and find employment dates
@@ -440,40 +666,34 @@ def parse_letter(text):
             end_dates = [d for d in employment_dates if d['type'] == 'end_date']
             
             if start_dates and end_dates:
-                start_date = start_dates[0]['parsed'].strftime('%Y-%m-%d')
-                end_date = end_dates[0]['parsed'].strftime('%Y-%m-%d')
+                start_dt = start_dates[0]['parsed']
+                end_dt = end_dates[0]['parsed']
             else:
                 # Fallback: use chronological order, but look for "from X to Y" patterns
-                from_to_pattern = r'from\s+([A-Za-z0-9\s,/.-]+?)\s+to\s+([A-Za-z0-9\s,/.-]+)'
-                from_to_match = re.search(from_to_pattern, cleaned_text, re.IGNORECASE)
+                from_to_match = _FROM_TO_RE.search(cleaned_text_lower)
                 
                 if from_to_match and len(employment_dates) >= 2:
                     # Sort by date value, not position
                     employment_dates.sort(key=lambda x: x['parsed'])
-                    start_date = employment_dates[0]['parsed'].strftime('%Y-%m-%d')
-                    end_date = employment_dates[-1]['parsed'].strftime('%Y-%m-%d')
+                    start_dt = employment_dates[0]['parsed']
+                    end_dt = employment_dates[-1]['parsed']
                 
         elif len(employment_dates) == 1:
             # Try to find duration mentioned in text
-            duration_match = re.search(r'(\d+(?:\.\d+)?)\s*years?', cleaned_text, re.IGNORECASE)
+            duration_match = _DURATION_RE.search(cleaned_text_lower)
             if duration_match:
                 duration_years = float(duration_match.group(1))
                 # If we have one date and duration, we can infer the other date
                 single_date = employment_dates[0]['parsed']
-                if employment_dates[0]['type'] == 'start_date' or re.search(r'from.*to|since.*until', cleaned_text, re.IGNORECASE):
-                    start_date = single_date.strftime('%Y-%m-%d')
+                if employment_dates[0]['type'] == 'start_date' or _has_range_hint(cleaned_text_lower):
+                    start_dt = single_date
                 else:
-                    end_date = single_date.strftime('%Y-%m-%d')
+                    end_dt = single_date
         
         # Calculate duration if we have both dates
-        if start_date and end_date:
-            try:
-                start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-                end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-                delta = end_dt - start_dt
-                duration_years = round(delta.days / 365.25, 2)
-            except ValueError:
-                pass
+        if start_dt and end_dt:
+            delta = end_dt.date() - start_dt.date()
+            duration_years = round(delta.days / 365.25, 2)
         
         # Populate extracted data
         if org_name:
@@ -482,10 +702,10 @@ def parse_letter(text):
             result["extracted_data"]["job_title"] = job_title
         if employee_name:
             result["extracted_data"]["employee_name"] = employee_name
-        if start_date:
-            result["extracted_data"]["start_date"] = start_date
-        if end_date:
-            result["extracted_data"]["end_date"] = end_date
+        if start_dt:
+            result["extracted_data"]["start_date"] = start_dt.strftime('%Y-%m-%d')
+        if end_dt:
+            result["extracted_data"]["end_date"] = end_dt.strftime('%Y-%m-%d')
         if duration_years:
             result["extracted_data"]["duration_years"] = duration_years
         
@@ -579,8 +799,8 @@ def validate_extracted_data(data, text):
     
     return consistency, anomalies
 
-def process_letter(file_path):
-    """Process experience letter based on file extension."""
+def process_letter(file_path, source=None):
+    """Process experience letter based on file extension; source is an optional file object with its bytes."""
     ext = Path(file_path).suffix.lower()
     text = None
     
@@ -595,13 +815,13 @@ def process_letter(file_path):
 
     try:
         if ext == ".pdf":
-            text = extract_text_from_pdf(file_path)
+            text = extract_text_from_pdf(file_path, source)
         elif ext == ".docx":
-            text = extract_text_from_docx(file_path)
+            text = extract_text_from_docx(file_path, source)
         elif ext == ".doc":
-            text = extract_text_from_doc(file_path)
+            text = extract_text_from_doc(file_path, source)
         elif ext in [".png", ".jpg", ".jpeg", ".tiff", ".bmp"]:
-            text = extract_text_from_image(file_path)
+            text = extract_text_from_image(file_path, source)
         
         if not text:
             if not TESSERACT_AVAILABLE and ext == ".pdf":
@@ -632,20 +852,80 @@ def process_letter(file_path):
         }
 
 def save_to_json(data, output_path):
-    """Save parsed data to JSON file with proper formatting."""
+    """Save parsed data to JSON file with proper formatting; the output folder must exist."""
     try:
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, "w", encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False, default=str)
+        if HAS_ORJSON:
+            with open(output_path, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
+        else:
+            with open(output_path, "w", encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
         logger.info(f"Output saved to {output_path}")
     except Exception as e:
         logger.error(f"Error saving JSON to {output_path}: {e}")
 
+# Bump whenever extraction output changes so cached results from older parsers are ignored
+PARSER_VERSION = 1
+
+# One Tesseract thread per worker; letters are parallelised across processes
+# instead, which avoids OpenMP oversubscription
+_SINGLE_THREAD_ENV = {'OMP_THREAD_LIMIT': '1', 'OMP_NUM_THREADS': '1'}
+
+def _log_level():
+    """Return the level named by LOGLEVEL, falling back to INFO for unknown names."""
+    level = logging.getLevelName(os.environ.get('LOGLEVEL', 'INFO').upper())
+    return level if isinstance(level, int) else logging.INFO
+
+def _init_worker():
+    """Pin a pool worker to single-threaded OpenMP, including tesseract subprocesses it starts."""
+    for name, value in _SINGLE_THREAD_ENV.items():
+        os.environ.setdefault(name, value)
+    # Spawned workers start without the CLI's logging setup
+    logging.basicConfig(level=_log_level(), format=LOG_FORMAT)
+
+def process_single_file(file_path, output_path):
+    """Process one letter and save its individual JSON output; runs in a pool worker."""
+    # Map the letter instead of copying it into memory; the same mapping is hashed
+    # in place and read by the extractors as a file object (empty files can't be mapped)
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else io.BytesIO()
+    
+    with source:
+        # Results are also stored under the file's content hash, so re-uploads and
+        # repeated runs over the same letter skip extraction entirely
+        digest = hashlib.blake2b(source if size else b'', digest_size=16).hexdigest()
+        cache_path = os.path.join(os.path.dirname(output_path), f"{digest}.v{PARSER_VERSION}.json")
+        if os.path.exists(cache_path):
+            with open(cache_path, 'rb') as f:
+                cached = f.read()
+            result = orjson.loads(cached) if HAS_ORJSON else json.loads(cached)
+            result["file_processed"] = file_path
+            save_to_json(result, output_path)
+            return result
+        
+        result = process_letter(file_path, source)
+    
+    # Failures may be environmental (e.g. OCR missing), so only successes are cached
+    if 'error' not in result:
+        save_to_json(result, cache_path)
+    save_to_json(result, output_path)
+    return result
+
 def main():
     """Process all experience letters in the uploads folder - individual outputs only."""
     uploads_dir = "uploads"
     outputs_dir = "outputs"
     
+    # Block-buffer stdout when it isn't a terminal; the report goes through logging on
+    # it, one record and one flush per letter, so LOGLEVEL=WARNING silences it entirely
+    if not sys.stdout.isatty():
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    logging.basicConfig(level=_log_level(), format=LOG_FORMAT, stream=sys.stdout)
+    
+    # Set before the pool starts so spawned workers load Tesseract with it already in place
+    _init_worker()
+    
     # Create directories if they don't exist
     os.makedirs(uploads_dir, exist_ok=True)
     os.makedirs(outputs_dir, exist_ok=True)
@@ -657,11 +937,15 @@ def main():
     # Get all supported files
     supported_extensions = {'.pdf', '.docx', '.doc', '.png', '.jpg', '.jpeg', '.tiff', '.bmp'}
     files_to_process = []
+    file_types = {}
     
-    for file in os.listdir(uploads_dir):
-        file_path = os.path.join(uploads_dir, file)
-        if os.path.isfile(file_path) and Path(file_path).suffix.lower() in supported_extensions:
-            files_to_process.append((file, file_path))
+    # scandir entries carry their stat info, so is_file() needs no extra syscall
+    with os.scandir(uploads_dir) as entries:
+        for entry in entries:
+            ext = os.path.splitext(entry.name)[1].lower()
+            if ext in supported_extensions and entry.is_file():
+                files_to_process.append((entry.name, entry.path))
+                file_types[ext] = file_types.get(ext, 0) + 1
     
     if not files_to_process:
         print(f"No supported files found in {uploads_dir}. Supported formats: {', '.join(supported_extensions)}")
@@ -670,56 +954,66 @@ def main():
     print(f"Found {len(files_to_process)} files to process...")
     
     # Show file types being processed
-    file_types = {}
-    for file, file_path in files_to_process:
-        ext = Path(file_path).suffix.lower()
-        file_types[ext] = file_types.get(ext, 0) + 1
-    
     print(f"File types: {', '.join([f'{count} {ext}' for ext, count in file_types.items()])}")
-    print()
+    print(flush=True)
     
     processed_count = 0
     error_count = 0
     ocr_needed_count = 0
     
-    for file, file_path in files_to_process:
-        print(f"Processing: {file}")
+    # Spawned rather than forked: a forked worker would inherit OpenMP state this
+    # process initialised when it imported tesserocr, before the limit was set
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+    ) as executor:
+        futures = {
+            executor.submit(process_single_file, file_path, os.path.join(outputs_dir, f"output_{file}.json")): file
+            for file, file_path in files_to_process
+        }
         
-        try:
-            result = process_letter(file_path)
-            
-            # Save individual result only
-            output_path = os.path.join(outputs_dir, f"output_{file}.json")
-            save_to_json(result, output_path)
+        # Report letters as they finish so one slow scan doesn't hold back the rest
+        for future in as_completed(futures):
+            file = futures[future]
+            # One log record per letter instead of one write per line
+            lines = [f"Processed: {file}"]
             
-            if 'error' not in result:
-                processed_count += 1
-                confidence = result.get('confidence_score', 0)
-                print(f"  ✓ Success - Confidence: {confidence:.2f}%")
+            try:
+                result = future.result()
                 
-                # Show extracted job title for verification
-                job_title = result.get('extracted_data', {}).get('job_title')
-                org_name = result.get('extracted_data', {}).get('org_name')
-                if job_title:
-                    print(f"    Job Title: {job_title}")
-                if org_name:
-                    print(f"    Organization: {org_name}")
-            else:
+                if 'error' not in result:
+                    processed_count += 1
+                    confidence = result.get('confidence_score', 0)
+                    lines.append(f"  ✓ Success - Confidence: {confidence:.2f}%")
+                    
+                    # Show extracted job title for verification
+                    job_title = result.get('extracted_data', {}).get('job_title')
+                    org_name = result.get('extracted_data', {}).get('org_name')
+                    if job_title:
+                        lines.append(f"    Job Title: {job_title}")
+                    if org_name:
+                        lines.append(f"    Organization: {org_name}")
+                else:
+                    error_count += 1
+                    error_msg = result['error']
+                    lines.append(f"  ✗ Failed - {error_msg}")
+                    
+                    # Provide specific guidance based on error type
+                    if "OCR not available for scanned documents" in error_msg:
+                        ocr_needed_count += 1
+                        lines.append(f"    📋 This appears to be a scanned document requiring OCR")
+                        lines.append(f"    💡 Install Tesseract OCR to process this file (see TESSERACT_SETUP.md)")
+                    elif "Could not extract text" in error_msg:
+                        lines.append(f"    📋 Text extraction failed - file may be corrupted or unsupported format")
+                    
+            except Exception as e:
                 error_count += 1
-                error_msg = result['error']
-                print(f"  ✗ Failed - {error_msg}")
-                
-                # Provide specific guidance based on error type
-                if "OCR not available for scanned documents" in error_msg:
-                    ocr_needed_count += 1
-                    print(f"    📋 This appears to be a scanned document requiring OCR")
-                    print(f"    💡 Install Tesseract OCR to process this file (see TESSERACT_SETUP.md)")
-                elif "Could not extract text" in error_msg:
-                    print(f"    📋 Text extraction failed - file may be corrupted or unsupported format")
-                
-        except Exception as e:
-            error_count += 1
-            print(f"  ✗ Failed - {str(e)}")
+                lines.append(f"  ✗ Failed - {str(e)}")
+            
+            logger.info("\n".join(lines))
+            # Show each letter as it finishes instead of when the buffer fills
+            sys.stdout.flush()
     
     # Print final summary without saving summary file
     print(f"\n{'='*50}")
@@ -1,4 +1,7 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from config.database import init_orm
 from routes.route import router_resumes
 from routes.route import router_payslips
 from routes.route import router_uploads
@@ -6,7 +9,13 @@ from routes.route import router_experience_letters
 from routes.route import router_certificates
 from fastapi.middleware.cors import CORSMiddleware
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    init_orm()
+    yield
+
+# orjson serializes every route response, including UUIDs and datetimes, natively
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
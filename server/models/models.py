@@ -1,5 +1,5 @@
-from sqlalchemy import Column, String, JSON, ARRAY, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, TIMESTAMP
+from sqlalchemy import Column, String, JSON, ARRAY, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID, TIMESTAMP, JSONB
 from sqlalchemy.orm import relationship
 from config.database import Base
 import uuid
@@ -7,19 +7,25 @@ from sqlalchemy.sql import func
 
 class Resume(Base):
     __tablename__ = "resumes"
+    # GIN (inverted) indexes so containment filters on skills and the tag arrays
+    # (e.g. tools @> ARRAY['python']) use an index instead of scanning every resume
+    __table_args__ = tuple(
+        Index(f"ix_resume_{column}_gin", column, postgresql_using="gin")
+        for column in ("skills", "tools", "concepts", "others")
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     file_name = Column(String, nullable=False)
-    skills = Column(JSON)  # JSONB for {"category": ["skill1", "skill2"]}
+    skills = Column(JSONB)  # JSONB for {"category": ["skill1", "skill2"]}
     tools = Column(ARRAY(String))  # Array of strings
     concepts = Column(ARRAY(String))  # Array of strings
     others = Column(ARRAY(String))  # Array of strings
-    resume_metadata = Column(JSON)  # JSONB for metadata
+    resume_metadata = Column(JSONB)  # JSONB for metadata
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
-    personal_information = relationship("PersonalInformation", uselist=False, back_populates="resume")
-    education = relationship("Education", back_populates="resume")
-    languages = relationship("Language", back_populates="resume")
+    personal_information = relationship("PersonalInformation", uselist=False, back_populates="resume", info={"eager": True})
+    education = relationship("Education", back_populates="resume", info={"eager": True})
+    languages = relationship("Language", back_populates="resume", info={"eager": True})
 
 class PersonalInformation(Base):
     __tablename__ = "personal_information"
@@ -37,7 +43,7 @@ class Education(Base):
     __tablename__ = "education"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    resume_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False)
+    resume_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False, index=True)
     institution = Column(String, nullable=True)
     degree = Column(String, nullable=True)
     field = Column(String, nullable=True)
@@ -48,7 +54,7 @@ class Language(Base):
     __tablename__ = "languages"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    resume_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False)
+    resume_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False, index=True)
     name = Column(String, nullable=True)  # Changed to nullable=True to match database
 
     resume = relationship("Resume", back_populates="languages")
@@ -62,7 +68,7 @@ class Payslip(Base):
     components = Column(JSON, nullable=True)  # JSONB for {"basic": 15000.0, "hra": 7000.0, ...}
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
-    employment_proof = relationship("EmploymentProof", uselist=False, back_populates="payslip")
+    employment_proof = relationship("EmploymentProof", uselist=False, back_populates="payslip", info={"eager": True})
 
 class EmploymentProof(Base):
     __tablename__ = "employment_proof"
@@ -84,9 +90,9 @@ class ExperienceLetter(Base):
     confidence_score = Column(String, nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
-    extracted_data = relationship("ExperienceLetterData", uselist=False, back_populates="experience_letter")
-    formatting_consistency = relationship("ExperienceLetterFormatting", uselist=False, back_populates="experience_letter")
-    anomalies = relationship("ExperienceLetterAnomaly", back_populates="experience_letter")
+    extracted_data = relationship("ExperienceLetterData", uselist=False, back_populates="experience_letter", info={"eager": True})
+    formatting_consistency = relationship("ExperienceLetterFormatting", uselist=False, back_populates="experience_letter", info={"eager": True})
+    anomalies = relationship("ExperienceLetterAnomaly", back_populates="experience_letter", info={"eager": True})
 
 class ExperienceLetterData(Base):
     __tablename__ = "experience_letter_data"
@@ -119,6 +125,8 @@ class ExperienceLetterFormatting(Base):
 
 class ExperienceLetterAnomaly(Base):
     __tablename__ = "experience_letter_anomalies"
+    # Leads with the FK, so it serves relationship loads as well as per-type lookups
+    __table_args__ = (Index("ix_anomaly_letter_type", "experience_letter_id", "anomaly_type"),)
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     experience_letter_id = Column(UUID(as_uuid=True), ForeignKey("experience_letters.id", ondelete="CASCADE"), nullable=False)
@@ -163,7 +171,7 @@ class Confidence_Scores(Base):
     __tablename__ = "confidence_scores"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    certificate_id = Column(UUID(as_uuid=True), ForeignKey("certificates.id", ondelete="CASCADE"), nullable=False)
+    certificate_id = Column(UUID(as_uuid=True), ForeignKey("certificates.id", ondelete="CASCADE"), nullable=False, index=True)
     university = Column(Float, nullable=True)
     degree = Column(Float, nullable=True)
     gpa = Column(Float, nullable=True)
@@ -177,7 +185,7 @@ class Extraction_Methods(Base):
     __tablename__ = "extraction_methods"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    certificate_id = Column(UUID(as_uuid=True), ForeignKey("certificates.id", ondelete="CASCADE"), nullable=False)
+    certificate_id = Column(UUID(as_uuid=True), ForeignKey("certificates.id", ondelete="CASCADE"), nullable=False, index=True)
     university = Column(String, nullable=True)
     degree = Column(String, nullable=True)
     gpa = Column(String, nullable=True)
@@ -190,7 +198,7 @@ class Raw_Matches_University(Base):
     __tablename__ = "raw_matches_university"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    certificate_id = Column(UUID(as_uuid=True), ForeignKey("certificates.id", ondelete="CASCADE"), nullable=False)
+    certificate_id = Column(UUID(as_uuid=True), ForeignKey("certificates.id", ondelete="CASCADE"), nullable=False, index=True)
     match = Column(String, nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
@@ -200,7 +208,7 @@ class Raw_Matches_Degree(Base):
     __tablename__ = "raw_matches_degree"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    certificate_id = Column(UUID(as_uuid=True), ForeignKey("certificates.id", ondelete="CASCADE"), nullable=False)
+    certificate_id = Column(UUID(as_uuid=True), ForeignKey("certificates.id", ondelete="CASCADE"), nullable=False, index=True)
     match = Column(String, nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
@@ -210,7 +218,7 @@ class Raw_Matches_GPA(Base):
     __tablename__ = "raw_matches_gpa"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    certificate_id = Column(UUID(as_uuid=True), ForeignKey("certificates.id", ondelete="CASCADE"), nullable=False)
+    certificate_id = Column(UUID(as_uuid=True), ForeignKey("certificates.id", ondelete="CASCADE"), nullable=False, index=True)
     match = Column(String, nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
@@ -220,7 +228,7 @@ class Raw_Matches_Graduation_Date(Base):
     __tablename__ = "raw_matches_graduation_date"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    certificate_id = Column(UUID(as_uuid=True), ForeignKey("certificates.id", ondelete="CASCADE"), nullable=False)
+    certificate_id = Column(UUID(as_uuid=True), ForeignKey("certificates.id", ondelete="CASCADE"), nullable=False, index=True)
     match = Column(String, nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
@@ -230,7 +238,7 @@ class Extracted_Entities_Universities(Base):
     __tablename__ = "extracted_entities_universities"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    certificate_id = Column(UUID(as_uuid=True), ForeignKey("certificates.id", ondelete="CASCADE"), nullable=False)
+    certificate_id = Column(UUID(as_uuid=True), ForeignKey("certificates.id", ondelete="CASCADE"), nullable=False, index=True)
     university = Column(String, nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
@@ -240,7 +248,7 @@ class Extracted_Entities_Organizations(Base):
     __tablename__ = "extracted_entities_organizations"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    certificate_id = Column(UUID(as_uuid=True), ForeignKey("certificates.id", ondelete="CASCADE"), nullable=False)
+    certificate_id = Column(UUID(as_uuid=True), ForeignKey("certificates.id", ondelete="CASCADE"), nullable=False, index=True)
     organization = Column(String, nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
@@ -250,7 +258,7 @@ class Extracted_Entities_Persons(Base):
     __tablename__ = "extracted_entities_persons"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    certificate_id = Column(UUID(as_uuid=True), ForeignKey("certificates.id", ondelete="CASCADE"), nullable=False)
+    certificate_id = Column(UUID(as_uuid=True), ForeignKey("certificates.id", ondelete="CASCADE"), nullable=False, index=True)
     person = Column(String, nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
@@ -260,7 +268,7 @@ class Authenticity(Base):
     __tablename__ = "authenticity"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    certificate_id = Column(UUID(as_uuid=True), ForeignKey("certificates.id", ondelete="CASCADE"), nullable=False)
+    certificate_id = Column(UUID(as_uuid=True), ForeignKey("certificates.id", ondelete="CASCADE"), nullable=False, index=True)
     overall_score = Column(Float, nullable=True)
     document_hash = Column(String, nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
@@ -277,7 +285,7 @@ class Digital_Signatures(Base):
     __tablename__ = "digital_signatures"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    authenticity_id = Column(UUID(as_uuid=True), ForeignKey("authenticity.id", ondelete="CASCADE"), nullable=False)
+    authenticity_id = Column(UUID(as_uuid=True), ForeignKey("authenticity.id", ondelete="CASCADE"), nullable=False, index=True)
     has_digital_signature = Column(String, nullable=True)  # Stored as string to match boolean as text
     signature_count = Column(Integer, nullable=True)
     encrypted = Column(String, nullable=True)  # Stored as string to match boolean as text
@@ -292,7 +300,7 @@ class Security_Features(Base):
     __tablename__ = "security_features"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    digital_signature_id = Column(UUID(as_uuid=True), ForeignKey("digital_signatures.id", ondelete="CASCADE"), nullable=False)
+    digital_signature_id = Column(UUID(as_uuid=True), ForeignKey("digital_signatures.id", ondelete="CASCADE"), nullable=False, index=True)
     feature = Column(String, nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
@@ -302,7 +310,7 @@ class Certificate_Metadata(Base):
     __tablename__ = "certificate_metadata"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    digital_signature_id = Column(UUID(as_uuid=True), ForeignKey("digital_signatures.id", ondelete="CASCADE"), nullable=False)
+    digital_signature_id = Column(UUID(as_uuid=True), ForeignKey("digital_signatures.id", ondelete="CASCADE"), nullable=False, index=True)
     creator = Column(String, nullable=True)
     producer = Column(String, nullable=True)
     subject = Column(String, nullable=True)
@@ -317,7 +325,7 @@ class QR_Codes(Base):
     __tablename__ = "qr_codes"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    authenticity_id = Column(UUID(as_uuid=True), ForeignKey("authenticity.id", ondelete="CASCADE"), nullable=False)
+    authenticity_id = Column(UUID(as_uuid=True), ForeignKey("authenticity.id", ondelete="CASCADE"), nullable=False, index=True)
     qr_code = Column(String, nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
@@ -327,7 +335,7 @@ class QR_Verification(Base):
     __tablename__ = "qr_verification"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    authenticity_id = Column(UUID(as_uuid=True), ForeignKey("authenticity.id", ondelete="CASCADE"), nullable=False)
+    authenticity_id = Column(UUID(as_uuid=True), ForeignKey("authenticity.id", ondelete="CASCADE"), nullable=False, index=True)
     verification = Column(String, nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
@@ -337,7 +345,7 @@ class Authenticity_Indicators(Base):
     __tablename__ = "authenticity_indicators"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    authenticity_id = Column(UUID(as_uuid=True), ForeignKey("authenticity.id", ondelete="CASCADE"), nullable=False)
+    authenticity_id = Column(UUID(as_uuid=True), ForeignKey("authenticity.id", ondelete="CASCADE"), nullable=False, index=True)
     indicator = Column(String, nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
@@ -347,7 +355,7 @@ class Risk_Factors(Base):
     __tablename__ = "risk_factors"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    authenticity_id = Column(UUID(as_uuid=True), ForeignKey("authenticity.id", ondelete="CASCADE"), nullable=False)
+    authenticity_id = Column(UUID(as_uuid=True), ForeignKey("authenticity.id", ondelete="CASCADE"), nullable=False, index=True)
     risk_factor = Column(String, nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
@@ -357,7 +365,7 @@ class Recommendations(Base):
     __tablename__ = "recommendations"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    authenticity_id = Column(UUID(as_uuid=True), ForeignKey("authenticity.id", ondelete="CASCADE"), nullable=False)
+    authenticity_id = Column(UUID(as_uuid=True), ForeignKey("authenticity.id", ondelete="CASCADE"), nullable=False, index=True)
     recommendation = Column(String, nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
 
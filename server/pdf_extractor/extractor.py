@@ -36,6 +36,7 @@ import sys
 import re
 import json
 import logging
+from contextvars import ContextVar
 from datetime import datetime
 from pathlib import Path
 import PyPDF2
@@ -59,6 +60,9 @@ import numpy as np
 UPLOADS_DIR = "uploads_resumes" #! Change later
 PROCESSED_DIR = "processed_resumes"  # ! Change later
 
+# Timestamp shared by every file of the running batch; None outside batch_process
+_batch_ts = ContextVar("_batch_ts", default=None)
+
 # Ensure directories exist
 Path(UPLOADS_DIR).mkdir(exist_ok=True)
 Path(PROCESSED_DIR).mkdir(exist_ok=True)
@@ -883,11 +887,12 @@ class EnhancedPDFExtractor:
         print(job_description)
         filename = os.path.basename(pdf_path)
         # logger.info(f"Processing {filename}")
+        now = _batch_ts.get() or datetime.now()
         
         results = {
             "file_path": pdf_path,
             "filename": filename,
-            "processed_at": datetime.now().isoformat()
+            "processed_at": now.isoformat()
         }
         
         # Extract text from PDF
@@ -921,7 +926,7 @@ class EnhancedPDFExtractor:
             results["fit_scores"] = self.calculate_fit_score(entities, job_description)
             
         # Generate UUID for this processed result
-        results["id"] = str(Path(filename).stem) + "_" + datetime.now().strftime("%Y%m%d%H%M%S")
+        results["id"] = str(Path(filename).stem) + "_" + now.strftime("%Y%m%d%H%M%S")
         
         return results
     
@@ -949,13 +954,20 @@ class EnhancedPDFExtractor:
             
         # logger.info(f"Found {len(pdf_files)} PDF files to process")
         
-        results = []
-        for pdf_file in pdf_files:
-            result = self.process_pdf(pdf_file, job_description, anonymize)
-            results.append(result)
+        # Stamp the whole batch once instead of reading the clock per file
+        batch_ts = datetime.now()
+        stamp = batch_ts.strftime('%Y%m%d%H%M%S')
+        token = _batch_ts.set(batch_ts)
+        try:
+            results = []
+            for pdf_file in pdf_files:
+                result = self.process_pdf(pdf_file, job_description, anonymize)
+                results.append(result)
+        finally:
+            _batch_ts.reset(token)
             
         # Save processed results
-        output_path = os.path.join(PROCESSED_DIR, f"batch_results_{datetime.now().strftime('%Y%m%d%H%M%S')}.json")
+        output_path = os.path.join(PROCESSED_DIR, f"batch_results_{stamp}.json")
         with open(output_path, 'w') as f:
             json.dump(results, f, indent=2)
             
@@ -968,7 +980,7 @@ class EnhancedPDFExtractor:
             ranked_candidates = self.rank_candidates(resumes, job_description)
             
             # Save ranked results
-            ranked_path = os.path.join(PROCESSED_DIR, f"ranked_candidates_{datetime.now().strftime('%Y%m%d%H%M%S')}.json")
+            ranked_path = os.path.join(PROCESSED_DIR, f"ranked_candidates_{stamp}.json")
             with open(ranked_path, 'w') as f:
                 json.dump(ranked_candidates, f, indent=2)
                 
@@ -18,7 +18,7 @@ router_resumes = APIRouter(prefix="/resumes", tags=["Resumes"])
 
 @router_resumes.get("/", response_model=list[schemas.ResumeResponse])
 async def get_resumes(db: Session = Depends(database.get_db)):
-    resumes = db.query(models.Resume).all()
+    resumes = database.query(db, models.Resume).all()
     return resumes
 
 @router_resumes.post("/", response_model=schemas.ResumeResponse)
@@ -42,15 +42,15 @@ async def post_resume(resume: schemas.ResumeCreate, db: Session = Depends(databa
     )
     db.add(db_personal_info)
 
-    # Create education entries
-    for edu in resume.education:
-        db_education = models.Education(resume_id=db_resume.id, **edu.dict())
-        db.add(db_education)
-
-    # Create language entries
-    for lang in resume.languages:
-        db_language = models.Language(resume_id=db_resume.id, **lang.dict())
-        db.add(db_language)
+    # Create education and language entries, one multi-row INSERT per table
+    if resume.education:
+        db.bulk_insert_mappings(models.Education, [
+            {"resume_id": db_resume.id, **edu.dict()} for edu in resume.education
+        ])
+    if resume.languages:
+        db.bulk_insert_mappings(models.Language, [
+            {"resume_id": db_resume.id, **lang.dict()} for lang in resume.languages
+        ])
 
     db.commit()
     db.refresh(db_resume)
@@ -58,7 +58,7 @@ async def post_resume(resume: schemas.ResumeCreate, db: Session = Depends(databa
 
 @router_resumes.get("/{id}", response_model=schemas.ResumeResponse)
 async def get_resume_by_id(id: UUID, db: Session = Depends(database.get_db)):
-    resume = db.query(models.Resume).filter(models.Resume.id == id).first()
+    resume = database.query(db, models.Resume).filter(models.Resume.id == id).first()
     if resume is None:
         raise HTTPException(status_code=404, detail="Resume not found")
     return resume
@@ -147,7 +147,7 @@ router_payslips = APIRouter(prefix="/payslips", tags=["Payslips"])
 
 @router_payslips.get("/", response_model=list[schemas.PayslipResponse])
 async def get_payslips(db: Session = Depends(database.get_db)):
-    payslips = db.query(models.Payslip).all()
+    payslips = database.query(db, models.Payslip).all()
     return payslips
 
 @router_payslips.post("/", response_model=schemas.PayslipResponse)
@@ -179,7 +179,7 @@ async def post_payslip(payslip: schemas.PayslipCreate, db: Session = Depends(dat
 
 @router_payslips.get("/{id}", response_model=schemas.PayslipResponse)
 async def get_payslip_by_id(id: UUID, db: Session = Depends(database.get_db)):
-    payslip = db.query(models.Payslip).filter(models.Payslip.id == id).first()
+    payslip = database.query(db, models.Payslip).filter(models.Payslip.id == id).first()
     if payslip is None:
         raise HTTPException(status_code=404, detail="Payslip not found")
     return payslip
@@ -290,7 +290,7 @@ if not os.path.exists(UPLOAD_DIR_EXPERIENCE_LETTERS):
 # Experience Letter Routes
 @router_experience_letters.get("/", response_model=list[schemas.ExperienceLetterResponse])
 async def get_experience_letters(db: Session = Depends(database.get_db)):
-    experience_letters = db.query(models.ExperienceLetter).all()
+    experience_letters = database.query(db, models.ExperienceLetter).all()
     return experience_letters
 
 @router_experience_letters.post("/", response_model=schemas.ExperienceLetterResponse)
@@ -328,13 +328,12 @@ async def post_experience_letter(
     )
     db.add(db_formatting)
 
-    # Create anomalies
-    for anomaly in experience_letter.anomalies:
-        db_anomaly = models.ExperienceLetterAnomaly(
-            experience_letter_id=db_experience_letter.id,
-            **anomaly.dict()
-        )
-        db.add(db_anomaly)
+    # Create anomalies in a single multi-row INSERT
+    if experience_letter.anomalies:
+        db.bulk_insert_mappings(models.ExperienceLetterAnomaly, [
+            {"experience_letter_id": db_experience_letter.id, **anomaly.dict()}
+            for anomaly in experience_letter.anomalies
+        ])
 
     db.commit()
     db.refresh(db_experience_letter)
@@ -342,7 +341,7 @@ async def post_experience_letter(
 
 @router_experience_letters.get("/{id}", response_model=schemas.ExperienceLetterResponse)
 async def get_experience_letter_by_id(id: UUID, db: Session = Depends(database.get_db)):
-    experience_letter = db.query(models.ExperienceLetter).filter(
+    experience_letter = database.query(db, models.ExperienceLetter).filter(
         models.ExperienceLetter.id == id
     ).first()
     if experience_letter is None:
@@ -434,13 +433,12 @@ async def process_experience_letters(
         )
         db.add(db_formatting)
 
-        # Create anomalies
-        for anomaly in experience_letter_data.anomalies:
-            db_anomaly = models.ExperienceLetterAnomaly(
-                experience_letter_id=db_experience_letter.id,
-                **anomaly.dict()
-            )
-            db.add(db_anomaly)
+        # Create anomalies in a single multi-row INSERT
+        if experience_letter_data.anomalies:
+            db.bulk_insert_mappings(models.ExperienceLetterAnomaly, [
+                {"experience_letter_id": db_experience_letter.id, **anomaly.dict()}
+                for anomaly in experience_letter_data.anomalies
+            ])
 
         db.commit()
         db.refresh(db_experience_letter)
@@ -512,7 +510,7 @@ from datetime import datetime
 
 @router_certificates.get("/", response_model=list[schemas.CertificateResponse])
 async def get_certificates(db: Session = Depends(database.get_db)):
-    certificates = db.query(models.Certificates).all()
+    certificates = database.query(db, models.Certificates).all()
     return certificates
 
 @router_certificates.post("/", response_model=schemas.CertificateResponse)
@@ -545,7 +543,7 @@ async def post_certificate(
 
 @router_certificates.get("/{id}", response_model=schemas.CertificateResponse)
 async def get_certificate_by_id(id: UUID, db: Session = Depends(database.get_db)):
-    certificate = db.query(models.Certificates).filter(models.Certificates.id == id).first()
+    certificate = database.query(db, models.Certificates).filter(models.Certificates.id == id).first()
     if certificate is None:
         raise HTTPException(status_code=404, detail="Certificate not found")
     return certificate